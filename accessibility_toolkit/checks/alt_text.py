@@ -2,12 +2,32 @@
 Alt text accessibility check implementation.
 """
 
+import re
+from functools import lru_cache
 from typing import List
 from bs4 import BeautifulSoup
 from .base import BaseCheck
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Generic terms that make alt text inadequate
+_INADEQUATE_RE = re.compile(
+    r"\b(?:image|photo|picture|img|graphic|icon|click here|read more|learn more|more info)\b",
+    re.IGNORECASE,
+)
+
+
+# Class-name fragments that suggest an image is decorative (substring match)
+_DECORATIVE_CLASS_RE = re.compile(r"decorative|ornamental|background|bg|decoration", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _alt_text_is_inadequate(alt_text: str) -> bool:
+    """Classify alt text, memoised across pages since crawls repeat the same values."""
+    stripped = alt_text.strip()
+    return len(stripped) < 3 or bool(_INADEQUATE_RE.search(stripped))
+
+
 class AltTextCheck(BaseCheck):
     """Check for missing or inadequate alt text on images."""
     
@@ -30,15 +50,16 @@ class AltTextCheck(BaseCheck):
         self.log_check_start(url)
         issues = []
         
-        # Find all image elements
-        images = self.find_elements_by_tag(soup, "img")
+        # Find all visible image elements
+        images = [
+            img for img in self.get_index(soup).by_tag["img"]
+            if self.is_visible_element(img)
+        ]
         
         for img in images:
-            if not self.is_visible_element(img):
-                continue
-                
-            alt_text = img.get("alt", "")
-            src = img.get("src", "")
+            attrs = img.attrs
+            alt_text = attrs.get("alt", "")
+            src = attrs.get("src", "")
             
             # Check for missing alt text
             if not alt_text:
@@ -120,28 +141,8 @@ class AltTextCheck(BaseCheck):
         )
     
     def _is_inadequate_alt(self, alt_text: str) -> bool:
-        """Check if alt text is inadequate."""
-        inadequate_patterns = [
-            "image", "photo", "picture", "img", "graphic", "icon",
-            "click here", "read more", "learn more", "more info"
-        ]
-        
-        alt_lower = alt_text.lower().strip()
-        
-        # Check for generic terms
-        for pattern in inadequate_patterns:
-            if pattern in alt_lower:
-                return True
-        
-        # Check for very short descriptions
-        if len(alt_text.strip()) < 3:
-            return True
-        
-        # Check for repetitive text
-        if alt_text.lower() in ["image", "photo", "picture"]:
-            return True
-        
-        return False
+        """Check if alt text is inadequate (too short or generic)."""
+        return _alt_text_is_inadequate(alt_text)
     
     def _is_decorative_image(self, img, alt_text: str) -> bool:
         """Determine if an image is decorative."""
@@ -149,31 +150,28 @@ class AltTextCheck(BaseCheck):
         if alt_text == "":
             return True
         
+        attrs = img.attrs
+        
         # Check for CSS classes that suggest decorative images
-        classes = img.get("class", [])
-        decorative_classes = ["decorative", "ornamental", "background", "bg", "decoration"]
+        classes = attrs.get("class", [])
         
-        for class_name in classes:
-            if any(dec in class_name.lower() for dec in decorative_classes):
-                return True
+        if any(_DECORATIVE_CLASS_RE.search(class_name) for class_name in classes):
+            return True
         
         # Check for role attribute
-        role = img.get("role", "")
+        role = attrs.get("role", "")
         if role == "presentation" or role == "none":
             return True
         
         # Check for aria-hidden
-        if img.get("aria-hidden") == "true":
+        if attrs.get("aria-hidden") == "true":
             return True
         
         # Check if image is very small (likely decorative)
-        width = img.get("width", "")
-        height = img.get("height", "")
-        if width and height:
-            try:
-                if int(width) <= 32 and int(height) <= 32:
-                    return True
-            except ValueError:
-                pass
+        width = attrs.get("width", "").strip()
+        height = attrs.get("height", "").strip()
+        if width.isdecimal() and height.isdecimal():
+            if int(width) <= 32 and int(height) <= 32:
+                return True
         
         return False
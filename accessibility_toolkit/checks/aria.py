@@ -2,12 +2,74 @@
 ARIA accessibility check implementation.
 """
 
-from typing import List
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from .base import BaseCheck
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Valid ARIA attributes
+_VALID_ARIA_ATTRS: FrozenSet[str] = frozenset({
+    'aria-label', 'aria-labelledby', 'aria-describedby', 'aria-hidden',
+    'aria-expanded', 'aria-collapsed', 'aria-selected', 'aria-checked',
+    'aria-pressed', 'aria-current', 'aria-required', 'aria-invalid',
+    'aria-live', 'aria-atomic', 'aria-relevant', 'aria-busy',
+    'aria-controls', 'aria-owns', 'aria-activedescendant', 'aria-posinset',
+    'aria-setsize', 'aria-level', 'aria-sort', 'aria-valuemin',
+    'aria-valuemax', 'aria-valuenow', 'aria-valuetext', 'aria-orientation',
+    'aria-autocomplete', 'aria-multiline', 'aria-readonly', 'aria-placeholder',
+    'aria-haspopup', 'aria-modal', 'aria-dialog', 'aria-tabindex',
+    'aria-roledescription', 'aria-keyshortcuts', 'aria-details'
+})
+
+# ARIA attributes that only accept 'true' or 'false' (iterated in this order)
+_BOOLEAN_ARIA: Tuple[str, ...] = ('aria-hidden', 'aria-required', 'aria-invalid', 'aria-busy')
+
+_BOOLEAN_VALUES: FrozenSet[str] = frozenset({'true', 'false'})
+
+# ARIA attributes with an enumerated set of valid values
+_ENUMERATED_ARIA: Dict[str, FrozenSet[str]] = {
+    'aria-expanded': frozenset({'true', 'false', 'undefined'}),
+    'aria-selected': frozenset({'true', 'false', 'undefined'}),
+    'aria-checked': frozenset({'true', 'false', 'mixed', 'undefined'}),
+    'aria-current': frozenset({'page', 'step', 'location', 'date', 'time', 'true', 'false'}),
+    'aria-live': frozenset({'off', 'polite', 'assertive'}),
+    'aria-orientation': frozenset({'horizontal', 'vertical'}),
+    'aria-sort': frozenset({'ascending', 'descending', 'none', 'other'}),
+}
+
+# Required ARIA attributes per role
+_ROLE_REQUIREMENTS: Dict[str, Tuple[str, ...]] = {
+    'button': (),
+    'checkbox': ('aria-checked',),
+    'combobox': ('aria-expanded',),
+    'dialog': ('aria-labelledby', 'aria-describedby'),
+    'grid': ('aria-rowcount', 'aria-colcount'),
+    'gridcell': ('aria-rowindex', 'aria-colindex'),
+    'listbox': ('aria-expanded',),
+    'menuitem': ('aria-haspopup',),
+    'menuitemcheckbox': ('aria-checked',),
+    'menuitemradio': ('aria-checked',),
+    'option': ('aria-selected',),
+    'progressbar': ('aria-valuemin', 'aria-valuemax', 'aria-valuenow'),
+    'radio': ('aria-checked',),
+    'scrollbar': ('aria-valuemin', 'aria-valuemax', 'aria-valuenow'),
+    'searchbox': ('aria-expanded',),
+    'slider': ('aria-valuemin', 'aria-valuemax', 'aria-valuenow'),
+    'spinbutton': ('aria-valuemin', 'aria-valuemax', 'aria-valuenow'),
+    'tab': ('aria-selected',),
+    'tabpanel': ('aria-labelledby',),
+    'textbox': ('aria-multiline',),
+    'toolbar': ('aria-label', 'aria-labelledby'),
+    'tooltip': ('aria-describedby',),
+    'tree': ('aria-multiselectable',),
+    'treeitem': ('aria-expanded', 'aria-level'),
+}
+
+_INTERACTIVE_TAGS: FrozenSet[str] = frozenset({'button', 'a', 'input', 'select', 'textarea'})
+_INTERACTIVE_ROLES: FrozenSet[str] = frozenset({'button', 'link', 'menuitem', 'tab', 'checkbox', 'radio'})
+
+
 class AriaCheck(BaseCheck):
     """Check for ARIA (Accessible Rich Internet Applications) issues."""
     
@@ -31,13 +93,9 @@ class AriaCheck(BaseCheck):
         self.log_check_start(url)
         issues = []
         
-        # Find all elements with ARIA attributes
-        aria_elements = self._find_aria_elements(soup)
-        
-        for element in aria_elements:
-            # Check for various ARIA issues
-            aria_issues = self._check_aria_element(element)
-            issues.extend(aria_issues)
+        # Check every element with ARIA attributes for various issues
+        for element in self._find_aria_elements(soup):
+            issues.extend(self._check_aria_element(element))
         
         # Check for elements that should have ARIA attributes
         missing_aria_issues = self._check_missing_aria(soup)
@@ -48,103 +106,73 @@ class AriaCheck(BaseCheck):
     
     def _find_aria_elements(self, soup: BeautifulSoup) -> List:
         """Find all elements that have ARIA attributes."""
-        aria_elements = []
-        
-        # Find elements with any aria-* attribute
-        for element in soup.find_all():
-            if any(attr.startswith('aria-') for attr in element.attrs.keys()):
-                aria_elements.append(element)
-        
-        return aria_elements
+        return self.get_index(soup).aria_elements
     
     def _check_aria_element(self, element) -> List[AccessibilityIssue]:
         """Check a single element with ARIA attributes for issues."""
         issues = []
+        attrs = element.attrs
         
         # Check for invalid ARIA attributes
         if self.check_invalid_attributes:
-            invalid_issues = self._check_invalid_aria_attributes(element)
+            invalid_issues = self._check_invalid_aria_attributes(element, attrs)
             issues.extend(invalid_issues)
         
         # Check for missing required ARIA attributes
         if self.check_required_attributes:
-            required_issues = self._check_required_aria_attributes(element)
+            required_issues = self._check_required_aria_attributes(element, attrs)
             issues.extend(required_issues)
         
         # Check for ARIA attribute values
-        value_issues = self._check_aria_attribute_values(element)
+        value_issues = self._check_aria_attribute_values(element, attrs)
         issues.extend(value_issues)
         
         return issues
     
-    def _check_invalid_aria_attributes(self, element) -> List[AccessibilityIssue]:
+    def _check_invalid_aria_attributes(self, element, attrs: Dict[str, Any]) -> List[AccessibilityIssue]:
         """Check for invalid ARIA attributes."""
-        issues = []
-        
-        # Valid ARIA attributes
-        valid_aria_attrs = {
-            'aria-label', 'aria-labelledby', 'aria-describedby', 'aria-hidden',
-            'aria-expanded', 'aria-collapsed', 'aria-selected', 'aria-checked',
-            'aria-pressed', 'aria-current', 'aria-required', 'aria-invalid',
-            'aria-live', 'aria-atomic', 'aria-relevant', 'aria-busy',
-            'aria-controls', 'aria-owns', 'aria-activedescendant', 'aria-posinset',
-            'aria-setsize', 'aria-level', 'aria-sort', 'aria-valuemin',
-            'aria-valuemax', 'aria-valuenow', 'aria-valuetext', 'aria-orientation',
-            'aria-autocomplete', 'aria-multiline', 'aria-readonly', 'aria-placeholder',
-            'aria-haspopup', 'aria-modal', 'aria-dialog', 'aria-tabindex',
-            'aria-roledescription', 'aria-keyshortcuts', 'aria-details'
-        }
-        
-        for attr in element.attrs.keys():
-            if attr.startswith('aria-') and attr not in valid_aria_attrs:
-                issues.append(self._create_invalid_aria_attribute_issue(element, attr))
-        
-        return issues
+        return [
+            self._create_invalid_aria_attribute_issue(element, attr)
+            for attr in attrs
+            if attr.startswith('aria-') and attr not in _VALID_ARIA_ATTRS
+        ]
     
-    def _check_required_aria_attributes(self, element) -> List[AccessibilityIssue]:
+    def _check_required_aria_attributes(self, element, attrs: Dict[str, Any]) -> List[AccessibilityIssue]:
         """Check for missing required ARIA attributes."""
         issues = []
+        get = attrs.get
         
         # Check role-based requirements
-        role = element.get('role')
+        role = get('role')
         if role:
-            required_attrs = self._get_required_aria_for_role(role)
-            for required_attr in required_attrs:
-                if not element.get(required_attr):
-                    issues.append(self._create_missing_required_aria_issue(element, role, required_attr))
+            issues.extend(
+                self._create_missing_required_aria_issue(element, role, required_attr)
+                for required_attr in self._get_required_aria_for_role(role)
+                if not get(required_attr)
+            )
         
         # Check for aria-label or aria-labelledby on interactive elements
-        if self._is_interactive_element(element):
-            if not element.get('aria-label') and not element.get('aria-labelledby'):
+        if self._is_interactive_element(element, attrs):
+            if not get('aria-label') and not get('aria-labelledby'):
                 if not self._has_visible_text(element):
                     issues.append(self._create_missing_aria_label_issue(element))
         
         return issues
     
-    def _check_aria_attribute_values(self, element) -> List[AccessibilityIssue]:
+    def _check_aria_attribute_values(self, element, attrs: Dict[str, Any]) -> List[AccessibilityIssue]:
         """Check for invalid ARIA attribute values."""
         issues = []
+        get = attrs.get
         
         # Check boolean attributes
-        boolean_attrs = ['aria-hidden', 'aria-required', 'aria-invalid', 'aria-busy']
-        for attr in boolean_attrs:
-            value = element.get(attr)
-            if value and value not in ['true', 'false']:
+        for attr in _BOOLEAN_ARIA:
+            value = get(attr)
+            if value and value not in _BOOLEAN_VALUES:
                 issues.append(self._create_invalid_aria_value_issue(element, attr, value))
         
         # Check enumerated attributes
-        enumerated_attrs = {
-            'aria-expanded': ['true', 'false', 'undefined'],
-            'aria-selected': ['true', 'false', 'undefined'],
-            'aria-checked': ['true', 'false', 'mixed', 'undefined'],
-            'aria-current': ['page', 'step', 'location', 'date', 'time', 'true', 'false'],
-            'aria-live': ['off', 'polite', 'assertive'],
-            'aria-orientation': ['horizontal', 'vertical'],
-            'aria-sort': ['ascending', 'descending', 'none', 'other']
-        }
-        
-        for attr, valid_values in enumerated_attrs.items():
-            value = element.get(attr)
+        for attr, valid_values in _ENUMERATED_ARIA.items():
+            value = get(attr)
             if value and value not in valid_values:
                 issues.append(self._create_invalid_aria_value_issue(element, attr, value))
         
@@ -167,71 +195,45 @@ class AriaCheck(BaseCheck):
         
         return issues
     
-    def _get_required_aria_for_role(self, role: str) -> List[str]:
+    def _get_required_aria_for_role(self, role: str) -> Tuple[str, ...]:
         """Get required ARIA attributes for a specific role."""
-        role_requirements = {
-            'button': [],
-            'checkbox': ['aria-checked'],
-            'combobox': ['aria-expanded'],
-            'dialog': ['aria-labelledby', 'aria-describedby'],
-            'grid': ['aria-rowcount', 'aria-colcount'],
-            'gridcell': ['aria-rowindex', 'aria-colindex'],
-            'listbox': ['aria-expanded'],
-            'menuitem': ['aria-haspopup'],
-            'menuitemcheckbox': ['aria-checked'],
-            'menuitemradio': ['aria-checked'],
-            'option': ['aria-selected'],
-            'progressbar': ['aria-valuemin', 'aria-valuemax', 'aria-valuenow'],
-            'radio': ['aria-checked'],
-            'scrollbar': ['aria-valuemin', 'aria-valuemax', 'aria-valuenow'],
-            'searchbox': ['aria-expanded'],
-            'slider': ['aria-valuemin', 'aria-valuemax', 'aria-valuenow'],
-            'spinbutton': ['aria-valuemin', 'aria-valuemax', 'aria-valuenow'],
-            'tab': ['aria-selected'],
-            'tabpanel': ['aria-labelledby'],
-            'textbox': ['aria-multiline'],
-            'toolbar': ['aria-label', 'aria-labelledby'],
-            'tooltip': ['aria-describedby'],
-            'tree': ['aria-multiselectable'],
-            'treeitem': ['aria-expanded', 'aria-level']
-        }
-        
-        return role_requirements.get(role, [])
+        return _ROLE_REQUIREMENTS.get(role, ())
     
-    def _is_interactive_element(self, element) -> bool:
+    def _is_interactive_element(self, element, attrs: Optional[Dict[str, Any]] = None) -> bool:
         """Check if an element is interactive."""
-        interactive_tags = ['button', 'a', 'input', 'select', 'textarea']
-        interactive_roles = ['button', 'link', 'menuitem', 'tab', 'checkbox', 'radio']
-        
-        if element.name in interactive_tags:
+        if element.name in _INTERACTIVE_TAGS:
             return True
         
-        role = element.get('role')
-        if role in interactive_roles:
-            return True
+        if attrs is None:
+            attrs = element.attrs
         
-        # Check for click handlers
-        onclick = element.get('onclick')
-        if onclick:
+        if attrs.get('role') in _INTERACTIVE_ROLES:
             return True
         
-        return False
+        # Check for click handlers
+        return bool(attrs.get('onclick'))
     
     def _has_visible_text(self, element) -> bool:
         """Check if an element has visible text content."""
-        text_content = element.get_text(strip=True)
-        return len(text_content) > 0
+        # Stop at the first non-blank string instead of joining the whole subtree
+        return next(element.stripped_strings, None) is not None
     
     def _find_elements_needing_roles(self, soup: BeautifulSoup) -> List:
         """Find elements that should have ARIA roles."""
         elements = []
         
         # Custom buttons (div/span with click handlers)
-        custom_buttons = soup.find_all(['div', 'span'], onclick=True)
+        custom_buttons = [
+            element for element in self.get_index(soup).onclick_elements
+            if element.name in ('div', 'span')
+        ]
         elements.extend(custom_buttons)
         
         # Custom form controls
-        custom_inputs = soup.find_all(['div', 'span'], class_=lambda x: x and 'input' in x.lower())
+        custom_inputs = [
+            element for element in self.get_index(soup).find_all(('div', 'span'))
+            if any('input' in class_name.lower() for class_name in element.get('class', ()))
+        ]
         elements.extend(custom_inputs)
         
         return elements
@@ -241,7 +243,10 @@ class AriaCheck(BaseCheck):
         elements = []
         
         # Elements with click handlers but no semantic meaning
-        clickable_divs = soup.find_all('div', onclick=True)
+        clickable_divs = [
+            element for element in self.get_index(soup).onclick_elements
+            if element.name == 'div'
+        ]
         for div in clickable_divs:
             if not div.get('role') and not div.get('aria-label'):
                 elements.append(div)
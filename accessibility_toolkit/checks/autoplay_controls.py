@@ -8,6 +8,20 @@ from .base import BaseCheck
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Severity of an autoplaying element keyed by (tag, has_controls, is_muted):
+# critical when it has no controls, or is audio that isn't muted
+_AUTOPLAY_SEVERITY = {
+    ("audio", False, False): SeverityLevel.CRITICAL,
+    ("audio", False, True): SeverityLevel.CRITICAL,
+    ("audio", True, False): SeverityLevel.CRITICAL,
+    ("audio", True, True): SeverityLevel.MODERATE,
+    ("video", False, False): SeverityLevel.CRITICAL,
+    ("video", False, True): SeverityLevel.CRITICAL,
+    ("video", True, False): SeverityLevel.MODERATE,
+    ("video", True, True): SeverityLevel.MODERATE,
+}
+
+
 class AutoplayControlsCheck(BaseCheck):
     """Flags autoplaying media and media elements missing visible controls."""
 
@@ -15,13 +29,14 @@ class AutoplayControlsCheck(BaseCheck):
         self.log_check_start(url)
         issues: List[AccessibilityIssue] = []
 
-        media_elements = list(soup.find_all("audio")) + list(soup.find_all("video"))
+        index = self.get_index(soup)
+        media_elements = index.by_tag["audio"] + index.by_tag["video"]
 
         for el in media_elements:
             tag = el.name
             has_controls = el.has_attr("controls")
             is_autoplay = el.has_attr("autoplay") or (el.get("data-autoplay") == "true")
-            is_muted = el.has_attr("muted") or (el.get("aria-muted") == "true")
+            is_muted = el.has_attr("muted") or el.get("aria-muted") == "true"
 
             # Missing controls
             if not has_controls:
@@ -41,7 +56,7 @@ class AutoplayControlsCheck(BaseCheck):
 
             # Autoplay without controls (or unmuted audio) is high risk
             if is_autoplay:
-                severity = SeverityLevel.CRITICAL if (tag == "audio" and not is_muted) or not has_controls else SeverityLevel.MODERATE
+                severity = _AUTOPLAY_SEVERITY[(tag, has_controls, is_muted)]
                 issues.append(
                     self.create_issue(
                         issue_type=IssueType.OTHER,
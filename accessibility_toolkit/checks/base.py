@@ -2,10 +2,36 @@
 Base class for all accessibility checks.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Union
 from bs4 import BeautifulSoup
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
+from ..element_index import ElementIndex
+
+
+logger = logging.getLogger(__name__)
+
+# Per-element memo of derived issue metadata, stored on the element itself so
+# it lives exactly as long as the parsed page and is never shared across
+# pages scanned in parallel. Read through ``__dict__`` because bs4 turns
+# unknown attribute access into find().
+_ELEMENT_CACHE_ATTR = "_accessibility_element_cache"
+
+# Void and replaced elements render without any text content of their own
+_REPLACED_ELEMENT_TAGS = frozenset({
+    "img", "input", "area", "svg", "video", "audio", "canvas",
+    "iframe", "embed", "object", "select", "textarea",
+})
+
+
+def _element_cache(element) -> Dict[Any, Any]:
+    """Return the metadata memo for an element, creating it on first use."""
+    cache = element.__dict__.get(_ELEMENT_CACHE_ATTR)
+    if cache is None:
+        cache = {}
+        setattr(element, _ELEMENT_CACHE_ATTR, cache)
+    return cache
 
 
 class BaseCheck(ABC):
@@ -84,22 +110,60 @@ class BaseCheck(ABC):
         Returns:
             Dictionary with element information
         """
-        info = {
-            "tag": element.name,
-            "classes": element.get("class", []),
-            "id": element.get("id", ""),
-            "attributes": dict(element.attrs),
-        }
+        cache = _element_cache(element)
+        info = cache.get("info")
+        if info is None:
+            info = {
+                "tag": element.name,
+                "classes": element.get("class", []),
+                "id": element.get("id", ""),
+                "attributes": dict(element.attrs),
+            }
+            
+            # Get text content (truncated if too long)
+            text_content = self.get_text_content(element)
+            if text_content:
+                info["text"] = text_content[:100] + "..." if len(text_content) > 100 else text_content
+            
+            cache["info"] = info
         
-        # Get text content (truncated if too long)
-        text_content = element.get_text(strip=True)
-        if text_content:
-            info["text"] = text_content[:100] + "..." if len(text_content) > 100 else text_content
+        # Issues keep this as additional_info, which de-duplication mutates
+        return dict(info)
+    
+    def get_text_content(self, element) -> str:
+        """
+        Get an element's stripped text, as ``get_text(strip=True)`` returns it.
         
-        return info
+        The text is memoised per element, since several checks and issue
+        builders read it for the same element and each call walks the subtree.
+        """
+        cache = _element_cache(element)
+        text = cache.get("text")
+        if text is None:
+            text = cache["text"] = element.get_text(strip=True)
+        return text
+    
+    def get_style(self, element) -> str:
+        """Get an element's inline style attribute, lower-cased and memoised."""
+        cache = _element_cache(element)
+        style = cache.get("style")
+        if style is None:
+            style = cache["style"] = (element.get("style") or "").lower()
+        return style
+    
+    def get_index(self, soup: BeautifulSoup) -> ElementIndex:
+        """Get the shared single-pass element index for a page."""
+        return ElementIndex.for_soup(soup)
     
-    def find_elements_by_tag(self, soup: BeautifulSoup, tag: str) -> List:
-        """Find all elements of a specific tag type."""
+    def find_elements_by_tag(self, soup: BeautifulSoup, tag: Union[str, Iterable[str]]) -> List:
+        """
+        Find all elements of one or more tag types, in document order.
+        
+        Whole-page lookups are answered from the page's shared element index,
+        so the list may be shared with other checks and must not be mutated.
+        """
+        if isinstance(soup, BeautifulSoup):
+            return self.get_index(soup).find_all(tag)
         return soup.find_all(tag)
     
     def find_elements_by_class(self, soup: BeautifulSoup, class_name: str) -> List:
@@ -121,6 +185,11 @@ class BaseCheck(ABC):
         Returns:
             String describing the element's context
         """
+        cache = _element_cache(element)
+        key = ("context", levels)
+        if key in cache:
+            return cache[key]
+        
         context_parts = []
         current = element
         
@@ -131,7 +200,9 @@ class BaseCheck(ABC):
             else:
                 break
         
-        return " > ".join(reversed(context_parts)) if context_parts else "unknown"
+        context = " > ".join(reversed(context_parts)) if context_parts else "unknown"
+        cache[key] = context
+        return context
     
     def is_visible_element(self, element) -> bool:
         """
@@ -143,17 +214,22 @@ class BaseCheck(ABC):
         Returns:
             True if element is likely visible
         """
-        # Check for common hidden attributes
-        hidden_attrs = ["hidden", "aria-hidden", "style"]
-        for attr in hidden_attrs:
-            if element.get(attr):
-                if attr == "style" and "display: none" in element.get(attr, ""):
-                    return False
-                elif attr in ["hidden", "aria-hidden"] and element.get(attr) == "true":
-                    return False
-        
-        # Check if element has no content
-        if not element.get_text(strip=True) and not element.find_all("img"):
+        # Check for common hidden attributes (most elements have none to check)
+        attrs = element.attrs
+        if attrs:
+            # ``hidden`` is a boolean attribute: present at all means hidden
+            if "hidden" in attrs or attrs.get("aria-hidden") == "true":
+                return False
+            style = attrs.get("style")
+            if style and "display:none" in style.replace(" ", "").lower():
+                return False
+        
+        # Void and replaced elements are visible without content
+        if element.name in _REPLACED_ELEMENT_TAGS:
+            return True
+        
+        # Check if element has no content, stopping at the first text or image found
+        if next(element.stripped_strings, None) is None and element.find("img") is None:
             return False
         
         return True
@@ -192,9 +268,8 @@ class BaseCheck(ABC):
     
     def log_check_start(self, url: str):
         """Log that a check is starting."""
-        print(f"🔍 Running {self.check_name} on {url}")
+        logger.info("Running %s on %s", self.check_name, url)
     
     def log_check_complete(self, url: str, issue_count: int):
         """Log that a check has completed."""
-        status = "✅" if issue_count == 0 else f"⚠️  {issue_count} issues found"
-        print(f"{status} {self.check_name} completed for {url}")
+        logger.info("%s completed for %s: %d issues found", self.check_name, url, issue_count)
@@ -2,12 +2,140 @@
 Color contrast accessibility check implementation.
 """
 
-from typing import List, Tuple
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Optional, Tuple
 from bs4 import BeautifulSoup
 from .base import BaseCheck
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Common text elements
+_TEXT_TAGS: FrozenSet[str] = frozenset({
+    "p", "span", "div", "a", "h1", "h2", "h3", "h4", "h5", "h6", "li", "td", "th", "label",
+})
+
+# Classes that suggest an element holds text
+_TEXT_CLASSES: FrozenSet[str] = frozenset({"text", "content", "description", "caption", "label"})
+
+# Common color name to hex mappings
+_NAMED_COLORS: Mapping[str, str] = MappingProxyType({
+    "black": "#000000",
+    "white": "#FFFFFF",
+    "red": "#FF0000",
+    "green": "#00FF00",
+    "blue": "#0000FF",
+    "yellow": "#FFFF00",
+    "cyan": "#00FFFF",
+    "magenta": "#FF00FF",
+    "gray": "#808080",
+    "grey": "#808080",
+    "silver": "#C0C0C0",
+    "maroon": "#800000",
+    "olive": "#808000",
+    "navy": "#000080",
+    "purple": "#800080",
+    "teal": "#008080",
+    "lime": "#00FF00",
+    "aqua": "#00FFFF",
+    "fuchsia": "#FF00FF",
+})
+
+# Common problematic color combinations
+_PROBLEMATIC_COLORS: Tuple[Tuple[str, str], ...] = (
+    ("#000000", "#666666"),  # Black on dark gray
+    ("#333333", "#CCCCCC"),  # Dark gray on light gray
+    ("#0066CC", "#FFFFFF"),  # Blue on white (might be too light)
+    ("#FF0000", "#FFFFFF"),  # Red on white
+    ("#00FF00", "#FFFFFF"),  # Green on white
+)
+# One bit per distinct problematic colour, and the two-bit mask of each pair
+_PROBLEMATIC_COLOR_BITS: Mapping[str, int] = MappingProxyType({
+    color: 1 << bit
+    for bit, color in enumerate(sorted({c.lower() for pair in _PROBLEMATIC_COLORS for c in pair}))
+})
+_PROBLEMATIC_PAIR_MASKS: Tuple[Tuple[str, str, int], ...] = tuple(
+    (fg, bg, _PROBLEMATIC_COLOR_BITS[fg.lower()] | _PROBLEMATIC_COLOR_BITS[bg.lower()])
+    for fg, bg in _PROBLEMATIC_COLORS
+)
+
+# Six-digit hex colour tokens (longer hex runs match on their first six digits)
+_HEX_COLOR_TOKEN_RE = re.compile(r"#[0-9a-f]{6}")
+
+# A complete short or long hex colour, without the leading "#"
+_HEX_COLOR_RE = re.compile(r"[0-9a-f]{3}|[0-9a-f]{6}", re.IGNORECASE)
+
+# Inline color declarations; the lookbehind keeps "color" from matching inside
+# "background-color" or "border-color"
+_COLOR_DECLARATION_RE = re.compile(r"(?<![\w-])(background-color|color):\s*([^;]+)", re.IGNORECASE)
+
+# Default rendered sizes of headings, in pixels
+_HEADING_SIZES: Mapping[str, int] = MappingProxyType({
+    "h1": 32, "h2": 24, "h3": 20, "h4": 18, "h5": 16, "h6": 14,
+})
+
+# Inline font size in pixels
+_FONT_SIZE_RE = re.compile(r"font-size:\s*(\d+)px", re.IGNORECASE)
+
+
+def _linearize_channel(value: int) -> float:
+    """Convert an 8-bit sRGB channel to linear light (WCAG 2 relative luminance)."""
+    c = value / 255
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+
+# Linearized value of every 8-bit sRGB channel, so luminance needs no pow() calls
+_SRGB_LUT: Tuple[float, ...] = tuple(_linearize_channel(value) for value in range(256))
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_rgb(hex_color: str) -> Optional[Tuple[int, int, int]]:
+    """Convert hex color to RGB tuple, or None if it is not a 3 or 6 digit hex color."""
+    hex_color = hex_color.lstrip("#")
+    # int(..., 16) would also accept signs, spaces and underscores
+    if not _HEX_COLOR_RE.fullmatch(hex_color):
+        return None
+    if len(hex_color) == 3:
+        hex_color = "".join([c + c for c in hex_color])
+    
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    
+    return (r, g, b)
+
+
+def _relative_luminance(rgb: Tuple[int, int, int]) -> float:
+    """Calculate relative luminance of RGB color."""
+    r, g, b = rgb
+    return 0.2126 * _SRGB_LUT[r] + 0.7152 * _SRGB_LUT[g] + 0.0722 * _SRGB_LUT[b]
+
+
+@lru_cache(maxsize=4096)
+def _contrast_ratio(fg_color: str, bg_color: str) -> Optional[float]:
+    """
+    Calculate the contrast ratio between two lower-case colors.
+    
+    Pages reuse a handful of color pairs across many elements, so results
+    are memoised for the life of the process.
+    """
+    # Convert hex to RGB
+    fg_rgb = _hex_to_rgb(fg_color)
+    bg_rgb = _hex_to_rgb(bg_color)
+    
+    if not fg_rgb or not bg_rgb:
+        return None
+    
+    # Calculate relative luminance
+    fg_luminance = _relative_luminance(fg_rgb)
+    bg_luminance = _relative_luminance(bg_rgb)
+    
+    # Calculate contrast ratio of the lighter over the darker color
+    ratio = (max(fg_luminance, bg_luminance) + 0.05) / (min(fg_luminance, bg_luminance) + 0.05)
+    return round(ratio, 2)
+
+
 class ColorContrastCheck(BaseCheck):
     """Check for color contrast issues in text and UI elements."""
     
@@ -50,19 +178,12 @@ class ColorContrastCheck(BaseCheck):
     
     def _find_text_elements(self, soup: BeautifulSoup) -> List:
         """Find elements that contain text and might have color contrast issues."""
-        # Common text elements
-        text_tags = ["p", "span", "div", "a", "h1", "h2", "h3", "h4", "h5", "h6", "li", "td", "th", "label"]
-        elements = []
-        
-        for tag in text_tags:
-            elements.extend(soup.find_all(tag))
-        
-        # Also check elements with specific classes that might be text
-        text_classes = ["text", "content", "description", "caption", "label"]
-        for class_name in text_classes:
-            elements.extend(soup.find_all(class_=class_name))
-        
-        return elements
+        # Common text elements, plus elements with classes that suggest text,
+        # each taken once and in document order
+        return [
+            element for element in self.get_index(soup).elements
+            if element.name in _TEXT_TAGS or not _TEXT_CLASSES.isdisjoint(element.get("class", ()))
+        ]
     
     def _extract_colors(self, element) -> List[Tuple[str, str]]:
         """
@@ -71,88 +192,73 @@ class ColorContrastCheck(BaseCheck):
         Returns:
             List of (foreground_color, background_color) tuples
         """
-        colors = []
+        # Get computed styles (this is a simplified approach); most text
+        # elements carry no inline style and so no colours to compare
+        style = element.get("style")
+        if not style:
+            return []
         
-        # Get computed styles (this is a simplified approach)
-        style = element.get("style", "")
-        classes = element.get("class", [])
+        colors = []
         
         # Check inline styles
-        if style:
-            fg_color = self._extract_color_from_style(style, "color")
-            bg_color = self._extract_color_from_style(style, "background-color")
-            
-            if fg_color and bg_color:
-                colors.append((fg_color, bg_color))
+        fg_color, bg_color = self._extract_colors_from_style(style)
+        
+        if fg_color and bg_color:
+            colors.append((fg_color, bg_color))
         
         # Check for common color combinations
         # This is a simplified approach - in a real implementation,
         # you'd want to use a proper CSS parser and computed styles
         
-        # Look for common problematic color combinations
-        problematic_colors = [
-            ("#000000", "#666666"),  # Black on dark gray
-            ("#333333", "#CCCCCC"),  # Dark gray on light gray
-            ("#0066CC", "#FFFFFF"),  # Blue on white (might be too light)
-            ("#FF0000", "#FFFFFF"),  # Red on white
-            ("#00FF00", "#FFFFFF"),  # Green on white
-        ]
-        
-        # Check if element has any of these color combinations
-        for fg, bg in problematic_colors:
-            if self._element_has_colors(element, fg, bg):
-                colors.append((fg, bg))
+        # Look for common problematic color combinations: one scan of the
+        # style's hex tokens sets a bit per problematic colour it mentions
+        mask = 0
+        for token in _HEX_COLOR_TOKEN_RE.findall(self.get_style(element)):
+            mask |= _PROBLEMATIC_COLOR_BITS.get(token, 0)
+        if mask:
+            colors.extend(
+                (fg, bg) for fg, bg, pair_mask in _PROBLEMATIC_PAIR_MASKS
+                if mask & pair_mask == pair_mask
+            )
         
         return colors
     
-    def _extract_color_from_style(self, style: str, property_name: str) -> str:
-        """Extract color value from CSS style string."""
-        import re
+    def _extract_colors_from_style(self, style: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract foreground and background colors from a CSS style string.
         
-        pattern = rf"{property_name}:\s*([^;]+)"
-        match = re.search(pattern, style, re.IGNORECASE)
+        Both declarations are found in a single scan; the first of each wins.
         
-        if match:
-            color = match.group(1).strip()
-            # Convert color names to hex if possible
-            return self._normalize_color(color)
+        Returns:
+            Tuple of normalized (foreground_color, background_color), None where missing
+        """
+        declarations = {}
+        for match in _COLOR_DECLARATION_RE.finditer(style):
+            declarations.setdefault(match.group(1).lower(), match.group(2))
         
-        return None
+        fg_color = declarations.get("color")
+        bg_color = declarations.get("background-color")
+        
+        # Convert color names to hex if possible
+        return (
+            self._normalize_color(fg_color) if fg_color else None,
+            self._normalize_color(bg_color) if bg_color else None,
+        )
     
     def _normalize_color(self, color: str) -> str:
         """Normalize color to hex format."""
-        # Common color name to hex mappings
-        color_map = {
-            "black": "#000000",
-            "white": "#FFFFFF",
-            "red": "#FF0000",
-            "green": "#00FF00",
-            "blue": "#0000FF",
-            "yellow": "#FFFF00",
-            "cyan": "#00FFFF",
-            "magenta": "#FF00FF",
-            "gray": "#808080",
-            "grey": "#808080",
-            "silver": "#C0C0C0",
-            "maroon": "#800000",
-            "olive": "#808000",
-            "navy": "#000080",
-            "purple": "#800080",
-            "teal": "#008080",
-            "lime": "#00FF00",
-            "aqua": "#00FFFF",
-            "fuchsia": "#FF00FF",
-        }
-        
-        color_lower = color.lower().strip()
+        color = color.strip()
         
         # If it's already a hex color
-        if color_lower.startswith("#"):
-            return color_lower
+        if color.startswith("#"):
+            return color.lower()
+        
+        color_lower = color.lower()
         
         # If it's a named color
-        if color_lower in color_map:
-            return color_map[color_lower]
+        named = _NAMED_COLORS.get(color_lower)
+        if named:
+            return named
         
         # If it's an RGB/RGBA value, try to convert
         if color_lower.startswith("rgb"):
@@ -161,19 +267,10 @@ class ColorContrastCheck(BaseCheck):
         
         return color_lower
     
-    def _element_has_colors(self, element, fg_color: str, bg_color: str) -> bool:
-        """Check if element has specific foreground and background colors."""
-        # This is a simplified check - in practice you'd want to check computed styles
-        style = element.get("style", "")
-        
-        fg_in_style = fg_color.lower() in style.lower()
-        bg_in_style = bg_color.lower() in style.lower()
-        
-        return fg_in_style and bg_in_style
-    
     def _check_element_contrast(self, element, colors: List[Tuple[str, str]]) -> List[AccessibilityIssue]:
         """Check contrast ratios for an element."""
         issues = []
+        required_ratio = None
         
         for fg_color, bg_color in colors:
             contrast_ratio = self._calculate_contrast_ratio(fg_color, bg_color)
@@ -181,10 +278,11 @@ class ColorContrastCheck(BaseCheck):
             if contrast_ratio is None:
                 continue
             
-            # Determine required contrast ratio based on text size
-            text_size = self._get_text_size(element)
-            is_large_text = self._is_large_text(element, text_size)
-            required_ratio = self.large_text_ratio if is_large_text else self.min_contrast_ratio
+            # Determine required contrast ratio based on text size, once per element
+            if required_ratio is None:
+                text_size = self._get_text_size(element)
+                is_large_text = self._is_large_text(element, text_size)
+                required_ratio = self.large_text_ratio if is_large_text else self.min_contrast_ratio
             
             if contrast_ratio < required_ratio:
                 severity = self._get_contrast_severity(contrast_ratio, required_ratio)
@@ -201,89 +299,37 @@ class ColorContrastCheck(BaseCheck):
         This is a simplified implementation. In practice, you'd want to use
         a proper color contrast calculation library.
         """
-        try:
-            # Convert hex to RGB
-            fg_rgb = self._hex_to_rgb(fg_color)
-            bg_rgb = self._hex_to_rgb(bg_color)
-            
-            if not fg_rgb or not bg_rgb:
-                return None
-            
-            # Calculate relative luminance
-            fg_luminance = self._calculate_luminance(fg_rgb)
-            bg_luminance = self._calculate_luminance(bg_rgb)
-            
-            # Calculate contrast ratio
-            if fg_luminance > bg_luminance:
-                lighter = fg_luminance
-                darker = bg_luminance
-            else:
-                lighter = bg_luminance
-                darker = fg_luminance
-            
-            ratio = (lighter + 0.05) / (darker + 0.05)
-            return round(ratio, 2)
-            
-        except Exception:
-            return None
+        return _contrast_ratio(fg_color.lower(), bg_color.lower())
     
     def _hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
-        try:
-            hex_color = hex_color.lstrip("#")
-            if len(hex_color) == 3:
-                hex_color = "".join([c + c for c in hex_color])
-            
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            
-            return (r, g, b)
-        except Exception:
-            return None
+        return _hex_to_rgb(hex_color.lower())
     
     def _calculate_luminance(self, rgb: Tuple[int, int, int]) -> float:
         """Calculate relative luminance of RGB color."""
-        r, g, b = rgb
-        
-        # Convert to sRGB
-        r = r / 255
-        g = g / 255
-        b = b / 255
-        
-        # Apply gamma correction
-        r = r ** 2.2 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-        g = g ** 2.2 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-        b = b ** 2.2 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-        
-        # Calculate luminance
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+        return _relative_luminance(rgb)
     
     def _get_text_size(self, element) -> int:
         """Get the text size of an element in pixels."""
-        style = element.get("style", "")
+        style = self.get_style(element)
         
         # Look for font-size in inline styles
-        import re
-        size_match = re.search(r"font-size:\s*(\d+)px", style, re.IGNORECASE)
-        if size_match:
-            return int(size_match.group(1))
-        
-        # Check for heading tags (they have default sizes)
-        if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            heading_sizes = {"h1": 32, "h2": 24, "h3": 20, "h4": 18, "h5": 16, "h6": 14}
-            return heading_sizes.get(element.name, 16)
+        if "font-size" in style:
+            size_match = _FONT_SIZE_RE.search(style)
+            if size_match:
+                return int(size_match.group(1))
         
-        # Default text size
-        return 16
+        # Headings have default sizes; other text uses the default text size
+        return _HEADING_SIZES.get(element.name, 16)
     
     def _is_large_text(self, element, text_size: int) -> bool:
         """Determine if text is considered large for contrast requirements."""
         # Check if text is bold
+        style = self.get_style(element)
         is_bold = (
             element.name in ["h1", "h2", "h3", "h4", "h5", "h6", "strong", "b"] or
-            "font-weight: bold" in element.get("style", "").lower() or
-            "font-weight: 700" in element.get("style", "").lower()
+            "font-weight: bold" in style or
+            "font-weight: 700" in style
         )
         
         # Large text is 18px+ or 14px+ bold
@@ -309,7 +355,7 @@ class ColorContrastCheck(BaseCheck):
         """Create a color contrast issue."""
         element_info = self.get_element_info(element)
         context = self.get_parent_context(element)
-        text_content = element.get_text(strip=True)[:50]
+        text_content = self.get_text_content(element)[:50]
         
         return self.create_issue(
             issue_type=IssueType.POOR_COLOR_CONTRAST,
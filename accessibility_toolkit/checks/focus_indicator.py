@@ -3,12 +3,24 @@ Heuristic check for missing/hidden keyboard focus indicators via CSS.
 Flags global outline suppression and elements with inline styles hiding focus.
 """
 
+import re
 from typing import List
 from bs4 import BeautifulSoup
 from .base import BaseCheck
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# An outline declaration that removes the outline ("none", "0" or "0px", but not "0.5px")
+_OUTLINE_SUPPRESSED = r"outline\s*:\s*(?:none|0(?![.\d]))"
+_OUTLINE_SUPPRESSED_RE = re.compile(_OUTLINE_SUPPRESSED, re.IGNORECASE)
+
+# The same declaration inside the body of a rule whose selector uses :focus
+_FOCUS_OUTLINE_RE = re.compile(r":focus[^{]*\{[^}]*" + _OUTLINE_SUPPRESSED, re.IGNORECASE)
+
+# Common interactive elements whose inline styles are checked
+_INTERACTIVE_TAGS = frozenset({"a", "button", "input", "textarea", "select", "summary"})
+
+
 class FocusIndicatorCheck(BaseCheck):
     """Detect CSS patterns that hide focus indicators."""
 
@@ -17,10 +29,9 @@ class FocusIndicatorCheck(BaseCheck):
         issues: List[AccessibilityIssue] = []
 
         # 1) Scan <style> blocks for outline suppression on :focus
-        for style_tag in soup.find_all("style"):
+        for style_tag in self.find_elements_by_tag(soup, "style"):
             css_text = style_tag.get_text() or ""
-            lowered = css_text.lower()
-            if ":focus" in lowered and ("outline: none" in lowered or "outline: 0" in lowered):
+            if _FOCUS_OUTLINE_RE.search(css_text):
                 snippet = css_text.strip()[:160] + ("..." if len(css_text.strip()) > 160 else "")
                 issues.append(
                     self.create_issue(
@@ -38,26 +49,30 @@ class FocusIndicatorCheck(BaseCheck):
                 )
 
         # 2) Check inline styles that remove outlines on common interactive elements
-        interactive_tags = ["a", "button", "input", "textarea", "select", "summary"]
-        for el in soup.find_all(interactive_tags):
-            style = (el.get("style") or "").lower()
-            if "outline: none" in style or "outline: 0" in style:
-                issues.append(
-                    self.create_issue(
-                        issue_type=IssueType.KEYBOARD_NAVIGATION,
-                        severity=SeverityLevel.LOW,
-                        description="Inline style removes focus outline on interactive element.",
-                        element=f"<{el.name}>",
-                        context=self.get_parent_context(el),
-                        line_number=self.get_line_number(el),
-                        column_number=self.get_column_number(el),
-                        suggested_fix=(
-                            "Remove outline suppression and provide a visible focus style (e.g., outline or box-shadow)."
-                        ),
-                        wcag_criteria=["2.4.7"],
-                        additional_info=self.get_element_info(el)
-                    )
+        # in one pass over the page's elements, without building a tag list
+        suppressed = (
+            el for el in self.get_index(soup).elements
+            if el.name in _INTERACTIVE_TAGS
+            and (style := el.attrs.get("style"))
+            and _OUTLINE_SUPPRESSED_RE.search(style)
+        )
+        for el in suppressed:
+            issues.append(
+                self.create_issue(
+                    issue_type=IssueType.KEYBOARD_NAVIGATION,
+                    severity=SeverityLevel.LOW,
+                    description="Inline style removes focus outline on interactive element.",
+                    element=f"<{el.name}>",
+                    context=self.get_parent_context(el),
+                    line_number=self.get_line_number(el),
+                    column_number=self.get_column_number(el),
+                    suggested_fix=(
+                        "Remove outline suppression and provide a visible focus style (e.g., outline or box-shadow)."
+                    ),
+                    wcag_criteria=["2.4.7"],
+                    additional_info=self.get_element_info(el)
                 )
+            )
 
         self.log_check_complete(url, len(issues))
         return issues
@@ -2,12 +2,57 @@
 Form accessibility check implementation.
 """
 
-from typing import List
-from bs4 import BeautifulSoup
-from .base import BaseCheck
+import re
+from typing import Any, Dict, List, NamedTuple
+from bs4 import BeautifulSoup, Tag
+from .base import BaseCheck, _element_cache
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Form controls checked individually, in the order their issues are reported
+_FORM_CONTROL_TAGS = ("input", "select", "textarea")
+
+# Element-cache key of a form's labels, mapped by their ``for`` attribute
+_LABEL_MAP_KEY = "labels_for"
+
+# Attributes that give a control an accessible name without a label element
+_ACCESSIBLE_NAME_ATTRS = frozenset({"aria-label", "aria-labelledby", "title"})
+
+# Attributes shown in an issue's element snippet, in this order
+_REPORTED_ATTRIBUTES = ("id", "name", "type", "required")
+
+# Input types that are expected to carry a placeholder when placeholders are required
+_PLACEHOLDER_INPUT_TYPES = frozenset({"text", "email", "password", "search", "tel", "url"})
+
+# Class-name fragments that mark an element as an error container, and the
+# roles that make one accessible
+_ERROR_CONTAINER_CLASS_RE = re.compile(r"error|alert|warning|invalid", re.IGNORECASE)
+_ERROR_CONTAINER_ROLES = frozenset({"alert", "status"})
+
+# Class-name fragments, text keywords and roles that mark an element as an error message
+_ERROR_MESSAGE_CLASS_RE = re.compile(r"error|alert|warning|invalid|danger", re.IGNORECASE)
+_ERROR_MESSAGE_TEXT_RE = re.compile(r"error|invalid|required|missing|incorrect|failed", re.IGNORECASE)
+_ERROR_MESSAGE_ROLES = frozenset({"alert", "alertdialog", "status"})
+
+# Generic phrases that make a short error message unhelpful
+_GENERIC_ERROR_RE = re.compile(
+    r"error|invalid|incorrect|wrong|failed|not valid|please fix|try again|something went wrong",
+    re.IGNORECASE,
+)
+
+
+class _FormParts(NamedTuple):
+    """What a single walk over a form's subtree found."""
+    controls: List
+    labels: List
+    invalid_elements: List
+    required_fields: List
+    error_containers: List
+    has_aria_label: bool
+    has_fieldset: bool
+    has_submit: bool
+
+
 class FormAccessibilityCheck(BaseCheck):
     """Check for form accessibility issues."""
     
@@ -22,6 +67,10 @@ class FormAccessibilityCheck(BaseCheck):
         """
         Check for form accessibility issues.
         
+        The soup is the one the scanner built with its configured parser:
+        html.parser by default, or lxml when ``parser: lxml`` is set. Results
+        are the same under either, except that lxml records no source lines.
+        
         Args:
             soup: BeautifulSoup object of the parsed HTML
             url: URL of the page being checked
@@ -36,28 +85,81 @@ class FormAccessibilityCheck(BaseCheck):
         forms = self.find_elements_by_tag(soup, "form")
         
         for form in forms:
+            # Collect what the per-form checks need in a single walk of its subtree
+            parts = self._scan_form(form)
+            _element_cache(form).setdefault(_LABEL_MAP_KEY, self._map_labels(parts.labels))
+            
             # Check form elements
-            form_issues = self._check_form_elements(form)
+            form_issues = self._check_form_elements(form, parts.controls)
             issues.extend(form_issues)
             
             # Check form structure
-            structure_issues = self._check_form_structure(form)
+            structure_issues = self._check_form_structure(form, parts)
             issues.extend(structure_issues)
             
             # Check error handling and validation
             if self.check_error_handling:
-                error_issues = self._check_error_handling(form)
+                error_issues = self._check_error_handling(form, parts)
                 issues.extend(error_issues)
         
         self.log_check_complete(url, len(issues))
         return issues
     
-    def _check_form_elements(self, form) -> List[AccessibilityIssue]:
+    def _scan_form(self, form) -> _FormParts:
+        """Walk a form's subtree once, collecting everything the per-form checks read."""
+        controls = []
+        labels = []
+        invalid_elements = []
+        required_fields = []
+        error_containers = []
+        has_aria_label = has_fieldset = has_submit = False
+        
+        for element in form.find_all(True):
+            name = element.name
+            attrs = element.attrs
+            if name in _FORM_CONTROL_TAGS:
+                controls.append(element)
+            elif name == "label":
+                labels.append(element)
+            elif name == "fieldset":
+                has_fieldset = True
+            
+            if "aria-label" in attrs:
+                has_aria_label = True
+            if name in ("input", "button") and attrs.get("type") == "submit":
+                has_submit = True
+            
+            # Error handling and validation candidates
+            if attrs.get("aria-invalid") == "true":
+                invalid_elements.append(element)
+            if attrs.get("required") is not None:
+                required_fields.append(element)
+            classes = attrs.get("class")
+            if classes:
+                if not isinstance(classes, str):
+                    classes = " ".join(classes)
+                if _ERROR_CONTAINER_CLASS_RE.search(classes):
+                    error_containers.append(element)
+        
+        return _FormParts(
+            controls, labels, invalid_elements, required_fields, error_containers,
+            has_aria_label, has_fieldset, has_submit,
+        )
+    
+    def _check_form_elements(self, form, controls: List) -> List[AccessibilityIssue]:
         """Check individual form elements for accessibility issues."""
         issues = []
         
+        # Split the form's controls by tag, dropping hidden inputs, which
+        # users never see and so need no label
+        by_tag = {tag: [] for tag in _FORM_CONTROL_TAGS}
+        for control in controls:
+            if control.name == "input" and control.get("type", "text") == "hidden":
+                continue
+            by_tag[control.name].append(control)
+        
         # Check input elements
-        inputs = form.find_all("input")
+        inputs = by_tag["input"]
         seen = set()
         for input_elem in inputs:
             sig = (
@@ -73,13 +175,13 @@ class FormAccessibilityCheck(BaseCheck):
             issues.extend(input_issues)
         
         # Check select elements
-        selects = form.find_all("select")
+        selects = by_tag["select"]
         for select_elem in selects:
             select_issues = self._check_select_element(select_elem)
             issues.extend(select_issues)
         
         # Check textarea elements
-        textareas = form.find_all("textarea")
+        textareas = by_tag["textarea"]
         for textarea_elem in textareas:
             textarea_issues = self._check_textarea_element(textarea_elem)
             issues.extend(textarea_issues)
@@ -91,17 +193,13 @@ class FormAccessibilityCheck(BaseCheck):
         issues = []
         input_type = input_elem.get("type", "text")
         
-        # Skip hidden inputs
-        if input_type == "hidden":
-            return issues
-        
         # Check for missing labels
         if self.require_labels and not self._has_proper_label(input_elem):
             issues.append(self._create_missing_label_issue(input_elem))
         
         # Check for missing placeholders (if required)
         if self.require_placeholders and not input_elem.get("placeholder"):
-            if input_type in ["text", "email", "password", "search", "tel", "url"]:
+            if input_type in _PLACEHOLDER_INPUT_TYPES:
                 issues.append(self._create_missing_placeholder_issue(input_elem))
         
         # Check for required fields without aria-required
@@ -120,12 +218,14 @@ class FormAccessibilityCheck(BaseCheck):
         """Check a select element for accessibility issues."""
         issues = []
         
+        labeled = self._has_proper_label(select_elem)
+        
         # Check for missing labels
-        if self.require_labels and not self._has_proper_label(select_elem):
+        if self.require_labels and not labeled:
             issues.append(self._create_missing_label_issue(select_elem))
         
         # Check for missing aria-label or aria-labelledby
-        if not self._has_proper_label(select_elem):
+        if not labeled:
             if not select_elem.get("aria-label") and not select_elem.get("aria-labelledby"):
                 issues.append(self._create_missing_aria_label_issue(select_elem))
         
@@ -140,12 +240,14 @@ class FormAccessibilityCheck(BaseCheck):
         """Check a textarea element for accessibility issues."""
         issues = []
         
+        labeled = self._has_proper_label(textarea_elem)
+        
         # Check for missing labels
-        if self.require_labels and not self._has_proper_label(textarea_elem):
+        if self.require_labels and not labeled:
             issues.append(self._create_missing_label_issue(textarea_elem))
         
         # Check for missing aria-label or aria-labelledby
-        if not self._has_proper_label(textarea_elem):
+        if not labeled:
             if not textarea_elem.get("aria-label") and not textarea_elem.get("aria-labelledby"):
                 issues.append(self._create_missing_aria_label_issue(textarea_elem))
         
@@ -156,36 +258,31 @@ class FormAccessibilityCheck(BaseCheck):
         
         return issues
     
-    def _check_form_structure(self, form) -> List[AccessibilityIssue]:
+    def _check_form_structure(self, form, parts: _FormParts) -> List[AccessibilityIssue]:
         """Check form structure for accessibility issues."""
         issues = []
         
         # Check for missing form labels
-        if not form.find("label") and not form.find(attrs={"aria-label": True}):
+        if not parts.labels and not parts.has_aria_label:
             issues.append(self._create_missing_form_label_issue(form))
         
         # Check for missing fieldset/legend on complex forms
-        if self._is_complex_form(form):
-            if not form.find("fieldset"):
+        if self._is_complex_form(parts.controls):
+            if not parts.has_fieldset:
                 issues.append(self._create_missing_fieldset_issue(form))
         
         # Check for missing submit button
-        submit_buttons = form.find_all("input", type="submit")
-        submit_buttons.extend(form.find_all("button", type="submit"))
-        
-        if not submit_buttons:
+        if not parts.has_submit:
             issues.append(self._create_missing_submit_button_issue(form))
         
         return issues
     
-    def _check_error_handling(self, form) -> List[AccessibilityIssue]:
+    def _check_error_handling(self, form, parts: _FormParts) -> List[AccessibilityIssue]:
         """Check form error handling and validation accessibility."""
         issues = []
         
         # Check for form elements with validation errors
-        invalid_elements = form.find_all(attrs={"aria-invalid": "true"})
-        
-        for element in invalid_elements:
+        for element in parts.invalid_elements:
             # Check if error message is properly associated
             if not self._has_error_message_association(element):
                 issues.append(self._create_missing_error_association_issue(element))
@@ -196,14 +293,12 @@ class FormAccessibilityCheck(BaseCheck):
                 issues.append(self._create_non_descriptive_error_issue(element, error_msg))
         
         # Check for required fields without clear indication
-        required_fields = form.find_all(attrs={"required": True})
-        for field in required_fields:
+        for field in parts.required_fields:
             if not self._has_clear_required_indication(field):
                 issues.append(self._create_missing_required_indication_issue(field))
         
         # Check for form submission errors without clear messaging
-        error_containers = form.find_all(class_=lambda x: x and any(word in x.lower() for word in ["error", "alert", "warning", "invalid"]))
-        for container in error_containers:
+        for container in parts.error_containers:
             if not self._has_accessible_error_content(container):
                 issues.append(self._create_inaccessible_error_content_issue(container))
         
@@ -212,17 +307,17 @@ class FormAccessibilityCheck(BaseCheck):
     def _has_error_message_association(self, element) -> bool:
         """Check if an element has proper error message association."""
         # Check for aria-describedby pointing to error message
-        if element.get("aria-describedby"):
-            describedby_ids = element.get("aria-describedby").split()
-            for error_id in describedby_ids:
-                error_element = element.find_parent().find(id=error_id)
+        describedby = element.get("aria-describedby")
+        if describedby:
+            for error_id in describedby.split():
+                error_element = self._find_nearby_id(element, error_id)
                 if error_element and self._is_error_message(error_element):
                     return True
         
         # Check for aria-errormessage (newer standard)
-        if element.get("aria-errormessage"):
-            error_id = element.get("aria-errormessage")
-            error_element = element.find_parent().find(id=error_id)
+        error_id = element.get("aria-errormessage")
+        if error_id:
+            error_element = self._find_nearby_id(element, error_id)
             if error_element and self._is_error_message(error_element):
                 return True
         
@@ -232,66 +327,80 @@ class FormAccessibilityCheck(BaseCheck):
         
         return False
     
+    def _find_nearby_id(self, element, element_id: str):
+        """
+        Find the first element with an id within the element's parent.
+        
+        The parent's descendants are mapped by id once and the mapping is
+        memoised on the parent, so repeated references resolve with a dict lookup.
+        """
+        parent = element.find_parent()
+        cache = _element_cache(parent)
+        ids = cache.get("ids")
+        if ids is None:
+            ids = cache["ids"] = {}
+            for candidate in parent.find_all(id=True):
+                ids.setdefault(candidate["id"], candidate)
+        return ids.get(element_id)
+    
     def _is_error_message(self, element) -> bool:
         """Check if an element appears to be an error message."""
         # Check for error-related classes
         classes = element.get("class", [])
-        if isinstance(classes, str):
-            classes = [classes]
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
         
-        error_classes = ["error", "alert", "warning", "invalid", "danger", "text-danger"]
-        if any(error_class in " ".join(classes).lower() for error_class in error_classes):
+        if _ERROR_MESSAGE_CLASS_RE.search(classes):
             return True
         
         # Check for error-related ARIA roles
-        if element.get("role") in ["alert", "alertdialog", "status"]:
+        if element.get("role") in _ERROR_MESSAGE_ROLES:
             return True
         
         # Check for error-related text content
-        text = element.get_text(strip=True).lower()
-        error_keywords = ["error", "invalid", "required", "missing", "incorrect", "failed"]
-        if any(keyword in text for keyword in error_keywords):
+        if _ERROR_MESSAGE_TEXT_RE.search(self.get_text_content(element)):
             return True
         
         return False
     
     def _has_nearby_error_message(self, element) -> bool:
         """Check if there's an error message near the form element."""
-        # Look for error messages in the same container or nearby
+        # Look for error messages in the same container or nearby, stopping
+        # at the first one found
         parent = element.parent
         if parent:
             # Check siblings for error messages
-            siblings = parent.find_all(recursive=False)
-            for sibling in siblings:
-                if self._is_error_message(sibling):
-                    return True
+            if any(self._is_error_message(sibling) for sibling in self._child_tags(parent)):
+                return True
             
             # Check parent's siblings
             grandparent = parent.parent
             if grandparent:
-                parent_siblings = grandparent.find_all(recursive=False)
-                for sibling in parent_siblings:
-                    if self._is_error_message(sibling):
-                        return True
+                if any(self._is_error_message(sibling) for sibling in self._child_tags(grandparent)):
+                    return True
         
         return False
     
+    def _child_tags(self, element):
+        """Iterate over an element's direct child tags without building a list."""
+        return (child for child in element.children if isinstance(child, Tag))
+    
     def _get_error_message(self, element) -> str:
         """Get the error message text for an element if available."""
         # Try to get error message via aria-describedby
-        if element.get("aria-describedby"):
-            describedby_ids = element.get("aria-describedby").split()
-            for error_id in describedby_ids:
-                error_element = element.find_parent().find(id=error_id)
+        describedby = element.get("aria-describedby")
+        if describedby:
+            for error_id in describedby.split():
+                error_element = self._find_nearby_id(element, error_id)
                 if error_element:
-                    return error_element.get_text(strip=True)
+                    return self.get_text_content(error_element)
         
         # Try to get error message via aria-errormessage
-        if element.get("aria-errormessage"):
-            error_id = element.get("aria-errormessage")
-            error_element = element.find_parent().find(id=error_id)
+        error_id = element.get("aria-errormessage")
+        if error_id:
+            error_element = self._find_nearby_id(element, error_id)
             if error_element:
-                return error_element.get_text(strip=True)
+                return self.get_text_content(error_element)
         
         return ""
     
@@ -300,17 +409,10 @@ class FormAccessibilityCheck(BaseCheck):
         if not error_text:
             return False
         
-        # Check for generic error messages
-        generic_errors = [
-            "error", "invalid", "incorrect", "wrong", "failed", "not valid",
-            "please fix", "try again", "something went wrong"
-        ]
-        
-        error_lower = error_text.lower()
-        if any(generic in error_lower for generic in generic_errors):
-            # If it's generic, check if it provides additional context
-            if len(error_text) < 20:  # Too short to be helpful
-                return False
+        # Generic error messages are only helpful with additional context,
+        # so reject short ones (checking the cheap length test first)
+        if len(error_text) < 20 and _GENERIC_ERROR_RE.search(error_text):
+            return False
         
         return True
     
@@ -319,7 +421,7 @@ class FormAccessibilityCheck(BaseCheck):
         # Check for visual required indicator
         label = self._get_associated_label(element)
         if label:
-            label_text = label.get_text(strip=True)
+            label_text = self.get_text_content(label)
             if "*" in label_text or "required" in label_text.lower():
                 return True
         
@@ -336,11 +438,11 @@ class FormAccessibilityCheck(BaseCheck):
     def _has_accessible_error_content(self, container) -> bool:
         """Check if error container has accessible content."""
         # Check for proper ARIA role
-        if container.get("role") in ["alert", "status"]:
+        if container.get("role") in _ERROR_CONTAINER_ROLES:
             return True
         
         # Check for descriptive text content
-        text_content = container.get_text(strip=True)
+        text_content = self.get_text_content(container)
         if text_content and len(text_content) > 10:
             return True
         
@@ -355,7 +457,7 @@ class FormAccessibilityCheck(BaseCheck):
         element_id = element.get("id")
         if element_id:
             # Find label with matching for attribute
-            label = element.find_parent().find("label", attrs={"for": element_id})
+            label = self._find_label_for(element, element_id)
             if label:
                 return label
         
@@ -366,13 +468,38 @@ class FormAccessibilityCheck(BaseCheck):
         
         return None
     
+    def _find_label_for(self, element, element_id: str):
+        """
+        Find the first label for an id within the element's form.
+        
+        The form's labels are mapped by their ``for`` attribute once and the
+        mapping is memoised on the form, so every control in it resolves its
+        label with a dict lookup. Elements outside a form use their parent.
+        """
+        scope = element.find_parent("form") or element.find_parent()
+        cache = _element_cache(scope)
+        labels = cache.get(_LABEL_MAP_KEY)
+        if labels is None:
+            labels = cache[_LABEL_MAP_KEY] = self._map_labels(scope.find_all("label"))
+        return labels.get(element_id)
+    
+    def _map_labels(self, labels: List) -> Dict[str, Any]:
+        """Map labels by their ``for`` attribute, keeping the first label per id."""
+        label_map = {}
+        for label in labels:
+            target = label.get("for")
+            if target is not None:
+                label_map.setdefault(target, label)
+        return label_map
+    
     def _has_proper_label(self, element) -> bool:
         """Check if an element has a proper label."""
-        # Check for explicit label association
-        element_id = element.get("id")
-        if element_id:
-            label = element.find_parent().find("label", attrs={"for": element_id})
-            if label:
+        attrs = element.attrs
+        
+        # Check for aria-label, aria-labelledby or a title attribute first,
+        # since they need no tree lookups; most controls carry none of them
+        if not _ACCESSIBLE_NAME_ATTRS.isdisjoint(attrs):
+            if any(attrs.get(attr) for attr in _ACCESSIBLE_NAME_ATTRS):
                 return True
         
         # Check for wrapped label
@@ -380,27 +507,19 @@ class FormAccessibilityCheck(BaseCheck):
         if parent and parent.name == "label":
             return True
         
-        # Check for aria-label
-        if element.get("aria-label"):
-            return True
-        
-        # Check for aria-labelledby
-        if element.get("aria-labelledby"):
-            return True
-        
-        # Check for title attribute
-        if element.get("title"):
-            return True
+        # Check for explicit label association
+        element_id = attrs.get("id")
+        if element_id:
+            label = self._find_label_for(element, element_id)
+            if label:
+                return True
         
         return False
     
-    def _is_complex_form(self, form) -> bool:
+    def _is_complex_form(self, controls: List) -> bool:
         """Determine if a form is complex enough to need fieldset/legend."""
-        # Count form controls
-        controls = len(form.find_all("input")) + len(form.find_all("select")) + len(form.find_all("textarea"))
-        
         # Consider it complex if it has more than 3 controls
-        return controls > 3
+        return len(controls) > 3
     
     def _create_missing_label_issue(self, element) -> AccessibilityIssue:
         """Create an issue for missing form labels."""
@@ -411,7 +530,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.MISSING_FORM_LABELS,
             severity=SeverityLevel.CRITICAL,
             description=f"Form element missing label: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -435,7 +554,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.MISSING_FORM_LABELS,
             severity=SeverityLevel.LOW,
             description=f"Form element missing placeholder text: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -456,7 +575,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.INACCESSIBLE_FORMS,
             severity=SeverityLevel.MODERATE,
             description=f"Required form element missing aria-required attribute: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -477,7 +596,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.INACCESSIBLE_FORMS,
             severity=SeverityLevel.MODERATE,
             description=f"Form element with error missing aria-describedby: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -498,7 +617,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.INACCESSIBLE_FORMS,
             severity=SeverityLevel.MODERATE,
             description=f"Form element with validation error missing error message association: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -519,7 +638,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.INACCESSIBLE_FORMS,
             severity=SeverityLevel.LOW,
             description=f"Form element has non-descriptive error message: '{error_text}'",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -540,7 +659,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.INACCESSIBLE_FORMS,
             severity=SeverityLevel.MODERATE,
             description=f"Required form element missing clear indication: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -587,7 +706,7 @@ class FormAccessibilityCheck(BaseCheck):
             issue_type=IssueType.MISSING_ARIA_LABELS,
             severity=SeverityLevel.MODERATE,
             description=f"Form element missing accessible name: {element.name}",
-            element=f"<{element.name} {self._get_element_attributes(element)}>",
+            element=self._element_snippet(element),
             context=context,
             line_number=self.get_line_number(element),
             column_number=self.get_column_number(element),
@@ -662,10 +781,20 @@ class FormAccessibilityCheck(BaseCheck):
             additional_info=element_info
         )
     
+    def _element_snippet(self, element) -> str:
+        """
+        Get the short tag snippet reported for a form element.
+        
+        A control often gets several issues, so the snippet is built once
+        and memoised on the element.
+        """
+        cache = _element_cache(element)
+        snippet = cache.get("form_snippet")
+        if snippet is None:
+            snippet = cache["form_snippet"] = f"<{element.name} {self._get_element_attributes(element)}>"
+        return snippet
+    
     def _get_element_attributes(self, element) -> str:
         """Get a string representation of element attributes."""
-        attrs = []
-        for key, value in element.attrs.items():
-            if key in ["id", "name", "type", "required"]:
-                attrs.append(f'{key}="{value}"')
-        return " ".join(attrs)
+        attrs = element.attrs
+        return " ".join(f'{key}="{attrs[key]}"' for key in _REPORTED_ATTRIBUTES if key in attrs)
@@ -39,73 +39,47 @@ class HeadingHierarchyCheck(BaseCheck):
                 issues.append(self._create_no_headings_issue(soup))
             return issues
         
-        # Check for missing H1
-        if self.require_h1 and not self._has_h1(headings):
-            issues.append(self._create_missing_h1_issue(soup))
-        
-        # Check heading hierarchy
-        issues.extend(self._check_heading_hierarchy(headings))
-        
-        # Check for skipped heading levels
-        if self.check_skip_levels:
-            issues.extend(self._check_skipped_levels(headings))
-        
-        # Check for multiple H1s (should only be one per page)
-        h1_count = len([h for h in headings if h.name == "h1"])
-        if h1_count > 1:
-            issues.append(self._create_multiple_h1_issue(h1_count))
-        
-        self.log_check_complete(url, len(issues))
-        return issues
-    
-    def _has_h1(self, headings: List) -> bool:
-        """Check if there's at least one H1 heading."""
-        return any(h.name == "h1" for h in headings)
-    
-    def _check_heading_hierarchy(self, headings: List) -> List[AccessibilityIssue]:
-        """Check for proper heading hierarchy."""
-        issues = []
-        
-        # Sort headings by their position in the document
-        sorted_headings = sorted(headings, key=lambda h: self.get_line_number(h))
-        
+        # Walk the headings once, in document order, checking hierarchy as we
+        # go and recording which levels appear and how many H1s there are
+        hierarchy_issues = []
+        levels_seen = 0
+        h1_count = 0
         current_level = 0
-        for heading in sorted_headings:
+        for heading in headings:
             heading_level = int(heading.name[1])
+            levels_seen |= 1 << heading_level
+            if heading_level == 1:
+                h1_count += 1
             
             # Check if heading level is too deep
             if heading_level > self.max_heading_level:
-                issues.append(self._create_deep_heading_issue(heading, heading_level))
+                hierarchy_issues.append(self._create_deep_heading_issue(heading, heading_level))
             
             # Check for proper nesting (shouldn't skip more than one level)
             if heading_level > current_level + 1:
-                issues.append(self._create_skip_level_issue(heading, current_level, heading_level))
+                hierarchy_issues.append(self._create_skip_level_issue(heading, current_level, heading_level))
             
             current_level = heading_level
         
-        return issues
-    
-    def _check_skipped_levels(self, headings: List) -> List[AccessibilityIssue]:
-        """Check for skipped heading levels."""
-        issues = []
+        # Check for missing H1
+        if self.require_h1 and not h1_count:
+            issues.append(self._create_missing_h1_issue(soup))
         
-        # Group headings by level
-        heading_levels = {}
-        for heading in headings:
-            level = int(heading.name[1])
-            if level not in heading_levels:
-                heading_levels[level] = []
-            heading_levels[level].append(heading)
+        # Check heading hierarchy
+        issues.extend(hierarchy_issues)
         
-        # Check for gaps in heading levels
-        expected_levels = set(range(1, max(heading_levels.keys()) + 1))
-        actual_levels = set(heading_levels.keys())
-        missing_levels = expected_levels - actual_levels
+        # Check for gaps in heading levels up to the deepest one used
+        # (H1 itself is not required here if the page doesn't have one)
+        if self.check_skip_levels:
+            for missing_level in range(2, levels_seen.bit_length()):
+                if not levels_seen & (1 << missing_level):
+                    issues.append(self._create_missing_level_issue(missing_level))
         
-        for missing_level in missing_levels:
-            if missing_level > 1:  # Don't require H1 if page doesn't have one
-                issues.append(self._create_missing_level_issue(missing_level))
+        # Check for multiple H1s (should only be one per page)
+        if h1_count > 1:
+            issues.append(self._create_multiple_h1_issue(h1_count))
         
+        self.log_check_complete(url, len(issues))
         return issues
     
     def _create_no_headings_issue(self, soup: BeautifulSoup) -> AccessibilityIssue:
@@ -166,7 +140,7 @@ class HeadingHierarchyCheck(BaseCheck):
             issue_type=IssueType.IMPROPER_HEADING_HIERARCHY,
             severity=SeverityLevel.LOW,
             description=f"Heading level {heading_level} is too deep (max recommended: {self.max_heading_level})",
-            element=f"<{heading.name}>{heading.get_text(strip=True)[:50]}...</{heading.name}>",
+            element=f"<{heading.name}>{self.get_text_content(heading)[:50]}...</{heading.name}>",
             context=context,
             line_number=self.get_line_number(heading),
             column_number=self.get_column_number(heading),
@@ -187,7 +161,7 @@ class HeadingHierarchyCheck(BaseCheck):
             issue_type=IssueType.IMPROPER_HEADING_HIERARCHY,
             severity=SeverityLevel.MODERATE,
             description=f"Heading level jumps from {current_level} to {heading_level} (skipping levels)",
-            element=f"<{heading.name}>{heading.get_text(strip=True)[:50]}...</{heading.name}>",
+            element=f"<{heading.name}>{self.get_text_content(heading)[:50]}...</{heading.name}>",
             context=context,
             line_number=self.get_line_number(heading),
             column_number=self.get_column_number(heading),
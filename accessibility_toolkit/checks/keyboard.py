@@ -2,12 +2,42 @@
 Keyboard navigation accessibility check implementation.
 """
 
-from typing import List
+import re
+from typing import Dict, List, NamedTuple
 from bs4 import BeautifulSoup
-from .base import BaseCheck
+from .base import BaseCheck, _element_cache
 from ..models import AccessibilityIssue, IssueType, SeverityLevel
 
 
+# Standard interactive (and naturally focusable) tags, in the order their
+# elements are reported
+_INTERACTIVE_TAGS = ('a', 'button', 'input', 'select', 'textarea', 'label')
+
+# Tags that are always focusable, whatever their attributes
+_ALWAYS_FOCUSABLE_TAGS = frozenset({'button', 'select', 'textarea'})
+
+# Input types that never take keyboard focus
+_UNFOCUSABLE_INPUT_TYPES = frozenset({'hidden', 'file'})
+
+# Roles that make an element interactive, in the order their elements are reported
+_INTERACTIVE_ROLES = ('button', 'link', 'menuitem', 'tab', 'checkbox', 'radio')
+
+# Marks a link as a skip link when found in its class or text
+_SKIP_RE = re.compile(r"skip", re.I)
+
+# A valid tabindex value: an optionally negative integer
+_TABINDEX_RE = re.compile(r"-?\d+")
+
+
+class _KeyboardElements(NamedTuple):
+    """Attribute-selected elements gathered in a single pass over the page."""
+    by_role: Dict[str, List]
+    tabindex: List
+    contenteditable: List
+    aria_hidden: List
+    focus_traps: List
+
+
 class KeyboardNavigationCheck(BaseCheck):
     """Check for keyboard navigation accessibility issues."""
     
@@ -91,7 +121,7 @@ class KeyboardNavigationCheck(BaseCheck):
         focusable_elements = self._find_focusable_elements(soup)
         
         # Check for logical tab order
-        tab_order_issues = self._check_logical_tab_order(focusable_elements)
+        tab_order_issues = self._check_logical_tab_order(soup, focusable_elements)
         issues.extend(tab_order_issues)
         
         # Check for tabindex values
@@ -129,46 +159,90 @@ class KeyboardNavigationCheck(BaseCheck):
         
         return issues
     
+    def _scan_elements(self, soup: BeautifulSoup) -> _KeyboardElements:
+        """
+        Collect the attribute-selected elements this check needs.
+        
+        One pass over the page's indexed elements fills every bucket, in
+        document order, instead of one ``find_all`` tree walk per attribute.
+        The result is memoised on the soup.
+        """
+        cache = _element_cache(soup)
+        found = cache.get("keyboard_elements")
+        if found is not None:
+            return found
+        
+        found = _KeyboardElements({role: [] for role in _INTERACTIVE_ROLES}, [], [], [], [])
+        for element in self.get_index(soup).elements:
+            attrs = element.attrs
+            if not attrs:
+                continue
+            
+            role = attrs.get("role")
+            if role in found.by_role:
+                found.by_role[role].append(element)
+            if "tabindex" in attrs:
+                found.tabindex.append(element)
+            if "contenteditable" in attrs:
+                found.contenteditable.append(element)
+            if attrs.get("aria-hidden") == "true":
+                found.aria_hidden.append(element)
+            if "data-focus-trap" in attrs:
+                found.focus_traps.append(element)
+        
+        cache["keyboard_elements"] = found
+        return found
+    
     def _find_interactive_elements(self, soup: BeautifulSoup) -> List:
         """Find all interactive elements."""
         interactive_elements = []
         
-        # Standard interactive elements
-        interactive_tags = ['a', 'button', 'input', 'select', 'textarea', 'label']
-        for tag in interactive_tags:
-            interactive_elements.extend(soup.find_all(tag))
+        # Standard interactive elements, each tag's bucket taken from the page index
+        for tag in _INTERACTIVE_TAGS:
+            interactive_elements.extend(self.find_elements_by_tag(soup, tag))
         
         # Elements with click handlers
-        clickable_elements = soup.find_all(attrs={"onclick": True})
-        interactive_elements.extend(clickable_elements)
+        interactive_elements.extend(self.get_index(soup).onclick_elements)
         
         # Elements with roles that make them interactive
-        interactive_roles = ['button', 'link', 'menuitem', 'tab', 'checkbox', 'radio']
-        for role in interactive_roles:
-            role_elements = soup.find_all(attrs={"role": role})
-            interactive_elements.extend(role_elements)
+        by_role = self._scan_elements(soup).by_role
+        for role in _INTERACTIVE_ROLES:
+            interactive_elements.extend(by_role[role])
         
         return interactive_elements
     
     def _find_focusable_elements(self, soup: BeautifulSoup) -> List:
-        """Find all focusable elements."""
+        """
+        Find all focusable elements, each listed once.
+        
+        A naturally focusable element may also carry tabindex or
+        contenteditable; it keeps its first position so it is not reported
+        twice. Tags compare by markup, so duplicates are dropped by identity.
+        """
         focusable_elements = []
+        seen = set()
+        
+        def add(element):
+            if id(element) not in seen:
+                seen.add(id(element))
+                focusable_elements.append(element)
         
         # Elements that are naturally focusable
-        naturally_focusable = ['a', 'button', 'input', 'select', 'textarea', 'label']
-        for tag in naturally_focusable:
-            elements = soup.find_all(tag)
+        for tag in _INTERACTIVE_TAGS:
+            elements = self.find_elements_by_tag(soup, tag)
             for element in elements:
                 if self._is_naturally_focusable(element):
-                    focusable_elements.append(element)
+                    add(element)
+        
+        found = self._scan_elements(soup)
         
         # Elements with tabindex
-        tabindex_elements = soup.find_all(attrs={"tabindex": True})
-        focusable_elements.extend(tabindex_elements)
+        for element in found.tabindex:
+            add(element)
         
         # Elements with contenteditable
-        editable_elements = soup.find_all(attrs={"contenteditable": True})
-        focusable_elements.extend(editable_elements)
+        for element in found.contenteditable:
+            add(element)
         
         return focusable_elements
     
@@ -176,17 +250,13 @@ class KeyboardNavigationCheck(BaseCheck):
         """Check if an element is naturally focusable."""
         tag = element.name
         
-        if tag == 'a':
-            return bool(element.get('href'))
-        elif tag == 'button':
+        if tag in _ALWAYS_FOCUSABLE_TAGS:
             return True
+        elif tag == 'a':
+            return bool(element.get('href'))
         elif tag == 'input':
             input_type = element.get('type', 'text')
-            return input_type not in ['hidden', 'file']
-        elif tag == 'select':
-            return True
-        elif tag == 'textarea':
-            return True
+            return input_type not in _UNFOCUSABLE_INPUT_TYPES
         elif tag == 'label':
             # Labels are focusable if they have a 'for' attribute
             return bool(element.get('for'))
@@ -194,7 +264,20 @@ class KeyboardNavigationCheck(BaseCheck):
         return False
     
     def _is_focusable(self, element) -> bool:
-        """Check if an element can receive focus."""
+        """
+        Check if an element can receive focus.
+        
+        The answer depends only on the element's own attributes, so it is
+        memoised on the element for the other sub-checks that ask again.
+        """
+        cache = _element_cache(element)
+        focusable = cache.get("focusable")
+        if focusable is None:
+            focusable = cache["focusable"] = self._compute_focusable(element)
+        return focusable
+    
+    def _compute_focusable(self, element) -> bool:
+        """Work out whether an element can receive focus."""
         # Check if element is hidden
         if element.get('hidden') or element.get('aria-hidden') == 'true':
             return False
@@ -226,9 +309,12 @@ class KeyboardNavigationCheck(BaseCheck):
             return True
         
         # Check for focus-related classes
-        classes = element.get('class', [])
-        focus_classes = ['focus', 'focus-visible', 'focus-ring']
-        if any(focus_class in str(classes) for focus_class in focus_classes):
+        # 'focus-visible' and 'focus-ring' both contain 'focus', so one
+        # substring test per class name covers all three
+        classes = element.get('class') or []
+        if isinstance(classes, str):
+            classes = [classes]
+        if any('focus' in class_name for class_name in classes):
             return True
         
         # Check for focus-related attributes
@@ -237,18 +323,19 @@ class KeyboardNavigationCheck(BaseCheck):
         
         return False
     
-    def _check_logical_tab_order(self, focusable_elements: List) -> List[AccessibilityIssue]:
+    def _check_logical_tab_order(self, soup: BeautifulSoup, focusable_elements: List) -> List[AccessibilityIssue]:
         """Check for logical tab order."""
         issues = []
         
-        # Sort elements by their position in the document
-        sorted_elements = sorted(focusable_elements, key=lambda x: self.get_line_number(x))
+        # Sort elements by their position in the document; the focusable list
+        # is grouped by rule, and line numbers are all 0 under lxml
+        sorted_elements = sorted(focusable_elements, key=self.get_index(soup).position)
         
         # Check for elements that might break logical flow
         for i, element in enumerate(sorted_elements):
             # Check if element has a very high tabindex that might break flow
             tabindex = element.get('tabindex')
-            if tabindex and tabindex.isdigit():
+            if tabindex and _TABINDEX_RE.fullmatch(tabindex):
                 tabindex_val = int(tabindex)
                 if tabindex_val > 100:  # Arbitrary threshold
                     issues.append(self._create_high_tabindex_issue(element, tabindex_val))
@@ -263,7 +350,7 @@ class KeyboardNavigationCheck(BaseCheck):
             tabindex = element.get('tabindex')
             if tabindex:
                 # Check for non-numeric tabindex values
-                if not tabindex.replace('-', '').isdigit():
+                if not _TABINDEX_RE.fullmatch(tabindex):
                     issues.append(self._create_invalid_tabindex_issue(element, tabindex))
                 
                 # Check for tabindex="0" (unnecessary)
@@ -275,15 +362,33 @@ class KeyboardNavigationCheck(BaseCheck):
     
     def _find_skip_links(self, soup: BeautifulSoup) -> List:
         """Find skip links on the page."""
-        skip_links = []
-        
-        # Look for skip links
-        skip_links.extend(soup.find_all("a", href="#main"))
-        skip_links.extend(soup.find_all("a", href="#content"))
-        skip_links.extend(soup.find_all("a", class_=lambda x: x and "skip" in x.lower()))
-        skip_links.extend(soup.find_all("a", text=lambda x: x and "skip" in x.lower()))
+        to_main = []
+        to_content = []
+        by_class = []
+        by_text = []
+        
+        # Look for skip links, sorting each link into the kinds it matches in
+        # one pass over the page's links
+        for link in self.find_elements_by_tag(soup, "a"):
+            href = link.get("href")
+            if href == "#main":
+                to_main.append(link)
+            elif href == "#content":
+                to_content.append(link)
+            
+            classes = link.get("class")
+            if classes:
+                if not isinstance(classes, str):
+                    classes = " ".join(classes)
+                if _SKIP_RE.search(classes):
+                    by_class.append(link)
+            
+            # Only links whose text is a single string, as bs4's text= filter
+            text = link.string
+            if text and _SKIP_RE.search(text):
+                by_text.append(link)
         
-        return skip_links
+        return to_main + to_content + by_class + by_text
     
     def _is_skip_link_properly_positioned(self, skip_link) -> bool:
         """Check if skip link is properly positioned."""
@@ -301,15 +406,15 @@ class KeyboardNavigationCheck(BaseCheck):
         """Find elements that might trap keyboard focus."""
         potential_traps = []
         
+        found = self._scan_elements(soup)
+        
         # Check for elements with very restrictive focus management
-        focus_restrictive = soup.find_all(attrs={"aria-hidden": "true"})
-        for element in focus_restrictive:
+        for element in found.aria_hidden:
             if self._is_focusable(element):
                 potential_traps.append(element)
         
         # Check for elements with custom focus management
-        custom_focus = soup.find_all(attrs={"data-focus-trap": True})
-        potential_traps.extend(custom_focus)
+        potential_traps.extend(found.focus_traps)
         
         return potential_traps
     
@@ -57,7 +57,7 @@ class LandmarkCheck(BaseCheck):
         issues = []
         
         # Check for main element or role="main"
-        main_elements = soup.find_all("main")
+        main_elements = self.find_elements_by_tag(soup, "main")
         main_roles = soup.find_all(attrs={"role": "main"})
 
         has_main_element = len(main_elements) > 0
@@ -77,7 +77,7 @@ class LandmarkCheck(BaseCheck):
         issues = []
         
         # Check for nav elements
-        nav_elements = soup.find_all("nav")
+        nav_elements = self.find_elements_by_tag(soup, "nav")
         nav_roles = soup.find_all(attrs={"role": "navigation"})
         
         if not nav_elements and not nav_roles:
@@ -92,7 +92,7 @@ class LandmarkCheck(BaseCheck):
         issues = []
         
         # Check for duplicate navigation landmarks
-        nav_elements = soup.find_all("nav")
+        nav_elements = self.find_elements_by_tag(soup, "nav")
         nav_roles = soup.find_all(attrs={"role": "navigation"})
         total_nav = len(nav_elements) + len(nav_roles)
         
@@ -100,7 +100,7 @@ class LandmarkCheck(BaseCheck):
             issues.append(self._create_duplicate_navigation_landmark_issue(total_nav))
         
         # Check for duplicate banner landmarks
-        header_elements = soup.find_all("header")
+        header_elements = self.find_elements_by_tag(soup, "header")
         banner_roles = soup.find_all(attrs={"role": "banner"})
         total_banner = len(header_elements) + len(banner_roles)
         
@@ -108,7 +108,7 @@ class LandmarkCheck(BaseCheck):
             issues.append(self._create_duplicate_banner_landmark_issue(total_banner))
         
         # Check for duplicate contentinfo landmarks
-        footer_elements = soup.find_all("footer")
+        footer_elements = self.find_elements_by_tag(soup, "footer")
         contentinfo_roles = soup.find_all(attrs={"role": "contentinfo"})
         total_contentinfo = len(footer_elements) + len(contentinfo_roles)
         
@@ -157,7 +157,7 @@ class LandmarkCheck(BaseCheck):
         issues = []
         
         # Check if landmarks are properly nested
-        main_elements = soup.find_all("main")
+        main_elements = self.find_elements_by_tag(soup, "main")
         for main in main_elements:
             # Main should not contain other main landmarks
             nested_main = main.find_all("main")
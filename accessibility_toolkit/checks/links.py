@@ -85,7 +85,7 @@ class LinkAccessibilityCheck(BaseCheck):
     def _is_empty_link(self, link) -> bool:
         """Check if a link has no content."""
         # Check if link has no text content
-        text_content = link.get_text(strip=True)
+        text_content = self.get_text_content(link)
         if not text_content:
             # Check if it has images
             images = link.find_all("img")
@@ -96,7 +96,7 @@ class LinkAccessibilityCheck(BaseCheck):
     
     def _is_non_descriptive_link(self, link) -> bool:
         """Check if link text is non-descriptive with enhanced heuristics."""
-        text_content = link.get_text(strip=True)
+        text_content = self.get_text_content(link)
         
         # Enhanced non-descriptive link text patterns
         vague_patterns = {
@@ -234,8 +234,8 @@ class LinkAccessibilityCheck(BaseCheck):
             return False
         
         # Check if parent has descriptive text
-        parent_text = parent.get_text(strip=True)
-        link_text = link.get_text(strip=True)
+        parent_text = self.get_text_content(parent)
+        link_text = self.get_text_content(link)
         
         # Remove link text from parent text
         context_text = parent_text.replace(link_text, "").strip()
@@ -270,14 +270,14 @@ class LinkAccessibilityCheck(BaseCheck):
     
     def _has_image_only_content(self, link) -> bool:
         """Check if link contains only images."""
-        text_content = link.get_text(strip=True)
+        text_content = self.get_text_content(link)
         images = link.find_all("img")
         
         return not text_content and len(images) > 0
     
     def _has_new_window_warning(self, link) -> bool:
         """Check if link has a warning about opening in new window."""
-        text_content = link.get_text(strip=True).lower()
+        text_content = self.get_text_content(link).lower()
         title_attr = link.get("title", "").lower()
         
         warning_indicators = [
@@ -298,7 +298,7 @@ class LinkAccessibilityCheck(BaseCheck):
         # Group links by text content
         link_groups = {}
         for link in links:
-            text = link.get_text(strip=True)
+            text = self.get_text_content(link)
             if text:
                 if text not in link_groups:
                     link_groups[text] = []
@@ -341,7 +341,7 @@ class LinkAccessibilityCheck(BaseCheck):
         """Create an issue for non-descriptive link text."""
         element_info = self.get_element_info(link)
         context = self.get_parent_context(link)
-        link_text = link.get_text(strip=True)
+        link_text = self.get_text_content(link)
         
         # Enhanced suggested fix based on the type of vague text
         suggested_fix = self._get_enhanced_suggested_fix(link_text, link)
@@ -439,7 +439,7 @@ class LinkAccessibilityCheck(BaseCheck):
         """Create an issue for links opening in new windows without warning."""
         element_info = self.get_element_info(link)
         context = self.get_parent_context(link)
-        link_text = link.get_text(strip=True)
+        link_text = self.get_text_content(link)
         
         return self.create_issue(
             issue_type=IssueType.NON_DESCRIPTIVE_LINKS,
@@ -16,7 +16,7 @@ class MediaAccessibilityCheck(BaseCheck):
         issues: List[AccessibilityIssue] = []
 
         # Check <video> elements for <track kind="captions"|"subtitles">
-        for video in soup.find_all("video"):
+        for video in self.find_elements_by_tag(soup, "video"):
             has_caption_track = False
             for track in video.find_all("track"):
                 kind = (track.get("kind") or "").strip().lower()
@@ -44,7 +44,7 @@ class MediaAccessibilityCheck(BaseCheck):
                 )
 
         # Check <audio> elements for presence of nearby transcript
-        for audio in soup.find_all("audio"):
+        for audio in self.find_elements_by_tag(soup, "audio"):
             has_transcript_link = False
 
             # Heuristics: look for a sibling/parent-descendant link mentioning transcript
@@ -59,7 +59,7 @@ class MediaAccessibilityCheck(BaseCheck):
                 next_sib = next_sib.next_sibling
 
             for a in candidates:
-                text = (a.get_text(strip=True) or "").lower()
+                text = (self.get_text_content(a) or "").lower()
                 href = (a.get("href") or "").lower()
                 if "transcript" in text or "transcript" in href:
                     has_transcript_link = True
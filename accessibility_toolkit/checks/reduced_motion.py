@@ -16,7 +16,7 @@ class ReducedMotionCheck(BaseCheck):
         issues: List[AccessibilityIssue] = []
 
         css_texts = []
-        for style_tag in soup.find_all("style"):
+        for style_tag in self.find_elements_by_tag(soup, "style"):
             css = style_tag.get_text() or ""
             if css:
                 css_texts.append(css)
@@ -17,8 +17,8 @@ class SkipLinkCheck(BaseCheck):
 
         # Find anchors that could be skip links
         candidates = []
-        for a in soup.find_all("a"):
-            text = (a.get_text(strip=True) or "").lower()
+        for a in self.find_elements_by_tag(soup, "a"):
+            text = (self.get_text_content(a) or "").lower()
             href = (a.get("href") or "").lower()
             rel = (a.get("rel") or [])
             role = (a.get("role") or "").lower()
@@ -28,10 +28,12 @@ def main():
 @click.option('--config', '-c', help='Configuration file path')
 @click.option('--timeout', '-t', default=30, type=int, help='Timeout in seconds')
 @click.option('--max-retries', '-r', default=3, type=int, help='Maximum retry attempts')
+@click.option('--threads', '-j', default=None, type=click.IntRange(min=1),
+              help='Worker threads for page analysis (default: CPU count)')
 @click.option('--min-severity', '-s', default='low',
               type=click.Choice(['low', 'moderate', 'critical']),
               help='Minimum severity level to include in results')
-def scan(url, urls, output, config, timeout, max_retries, min_severity):
+def scan(url, urls, output, config, timeout, max_retries, threads, min_severity):
     """Scan website(s) for accessibility issues."""
     
     # Load configuration
@@ -40,8 +42,11 @@ def scan(url, urls, output, config, timeout, max_retries, min_severity):
     # Override config with CLI options
     config_data.update({
         'timeout': timeout,
-        'max_retries': max_retries
+        'max_retries': max_retries,
+        'min_severity': min_severity
     })
+    if threads:
+        config_data['threads'] = threads
     
     # Get URLs to scan
     urls_to_scan = []
@@ -0,0 +1,94 @@
+"""
+Single-pass element index shared by all checks scanning the same page.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Union
+from bs4 import BeautifulSoup, Tag
+
+
+# Attribute used to stash the index on the soup it was built from. Looked up
+# through ``__dict__`` because bs4 turns unknown attribute access into find().
+_INDEX_ATTR = "_accessibility_element_index"
+
+
+class ElementIndex:
+    """
+    Buckets every element of a parsed page in a single tree walk.
+
+    Checks used to call ``soup.find_all`` independently, walking the whole
+    tree once per query. The index walks ``soup.descendants`` once and hands
+    out pre-bucketed element lists instead.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Build the index for a parsed page.
+
+        Args:
+            soup: BeautifulSoup object of the parsed HTML
+        """
+        self.elements: List[Tag] = []
+        self.by_tag: Dict[str, List[Tag]] = defaultdict(list)
+        self.aria_elements: List[Tag] = []
+        self.onclick_elements: List[Tag] = []
+        self._positions: Optional[Dict[int, int]] = None
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            self.elements.append(element)
+            self.by_tag[element.name].append(element)
+
+            # Most elements carry no attributes at all; skip the prefix scan
+            attrs = element.attrs
+            if not attrs:
+                continue
+            if any(attr.startswith("aria-") for attr in attrs):
+                self.aria_elements.append(element)
+            if "onclick" in attrs:
+                self.onclick_elements.append(element)
+
+    @classmethod
+    def for_soup(cls, soup: BeautifulSoup) -> "ElementIndex":
+        """Return the index for a soup, building it on first use."""
+        index = soup.__dict__.get(_INDEX_ATTR)
+        if index is None:
+            index = cls(soup)
+            setattr(soup, _INDEX_ATTR, index)
+        return index
+
+    def position(self, element: Tag) -> int:
+        """
+        Return an element's position in document order.
+
+        Works under every parser, unlike ``sourceline``, which lxml leaves
+        unset. Positions are keyed by identity because tags compare by markup.
+
+        Args:
+            element: Element of the indexed page
+
+        Returns:
+            Zero-based index of the element in document order
+        """
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {id(element): i for i, element in enumerate(self.elements)}
+        return positions[id(element)]
+
+    def find_all(self, name: Union[str, Iterable[str]]) -> List[Tag]:
+        """
+        Return elements matching one or more tag names, in document order.
+
+        Args:
+            name: Tag name or iterable of tag names
+
+        Returns:
+            List of matching elements (shared for a single tag name; do not mutate)
+        """
+        if isinstance(name, str):
+            return self.by_tag[name]
+
+        names = frozenset(name)
+        return [element for element in self.elements if element.name in names]
@@ -2,13 +2,32 @@
 Data models for the accessibility toolkit.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 
 
+def _with_slots(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+    
+    Backport of ``@dataclass(slots=True)``, which needs Python 3.10. Scans
+    over many pages create tens of thousands of issues, and dropping the
+    per-instance ``__dict__`` roughly halves their memory.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Defaults live on the generated __init__; class attributes would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 class SeverityLevel(Enum):
     """Severity levels for accessibility issues."""
     CRITICAL = "critical"
@@ -31,6 +50,7 @@ class IssueType(Enum):
     OTHER = "other"
 
 
+@_with_slots
 @dataclass
 class AccessibilityIssue:
     """Represents a single accessibility issue found on a webpage."""
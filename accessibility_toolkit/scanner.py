@@ -6,10 +6,11 @@ import asyncio
 import time
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 
 # Try to import Playwright first, fallback to Pyppeteer
 try:
@@ -44,9 +45,14 @@ from .checks import (
     , LangTitleCheck
     , ReducedMotionCheck
 )
+from .element_index import ElementIndex
 from .utils import deduplicate_issues, filter_visible_elements
 
 
+# Ranking used when filtering issues by minimum severity
+_SEVERITY_ORDER = {"low": 1, "moderate": 2, "critical": 3}
+
+
 class AccessibilityScanner:
     """Main scanner class that performs accessibility checks on web pages."""
     
@@ -89,6 +95,11 @@ class AccessibilityScanner:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
         self.viewport = self.config.get("viewport", {"width": 1920, "height": 1080})
         self.wait_for = self.config.get("wait_for", 2000)  # milliseconds
+        self.threads = self.config.get("threads") or os.cpu_count() or 1
+        self.parser = self.config.get("parser", "html.parser")
+        # An empty or null setting in a config file means no filtering
+        self.min_severity = (self.config.get("min_severity") or "low").lower()
+        self._executor = None
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -188,6 +199,10 @@ class AccessibilityScanner:
         if self.session:
             await self.session.close()
             self.session = None
+        
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     async def scan_url(self, url: str) -> ScanResult:
         """
@@ -221,54 +236,11 @@ class AccessibilityScanner:
                     error_message="Failed to retrieve page content"
                 )
             
-            # Parse HTML
-            soup = BeautifulSoup(page_content, 'html.parser')
-            
-            # Extract page metadata
-            page_title = soup.title.string if soup.title else ""
-            page_description = ""
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc:
-                page_description = meta_desc.get('content', '')
-            
-            # Filter to only visible elements for scanning
-            visible_elements = filter_visible_elements(soup, self.viewport)
-            if not visible_elements:
-                # If no visible elements found, return success
-                return ScanResult(
-                    url=url,
-                    timestamp=None,
-                    issues=[],
-                    page_title=page_title,
-                    page_description=page_description,
-                    scan_duration=time.time() - start_time,
-                    status="completed",
-                    message="No visible content found to scan"
-                )
-            
-            # Run all accessibility checks
-            all_issues = []
-            for check in self.checks:
-                try:
-                    issues = check.check(soup, url)
-                    all_issues.extend(issues)
-                except Exception as e:
-                    print(f"Warning: Check {check.__class__.__name__} failed: {e}")
-                    continue
-            
-            # Apply de-duplication to remove repetitive issues
-            all_issues = deduplicate_issues(all_issues)
-            
-            scan_duration = time.time() - start_time
-            
-            return ScanResult(
-                url=url,
-                timestamp=None,
-                issues=all_issues,
-                page_title=page_title,
-                page_description=page_description,
-                scan_duration=scan_duration,
-                status="completed"
+            # Parse and check the page off the event loop so other pages can
+            # keep fetching while this one is analysed
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), self._analyze_page, url, page_content, start_time
             )
             
         except Exception as e:
@@ -281,6 +253,80 @@ class AccessibilityScanner:
                 scan_duration=scan_duration
             )
     
+    def _analyze_page(self, url: str, page_content: str, start_time: float) -> ScanResult:
+        """
+        Parse a page and run every check against it.
+        
+        Runs in the scanner's thread pool, one page per worker; each page gets
+        its own soup, so no parsed state is shared between workers.
+        
+        Args:
+            url: URL the content was fetched from
+            page_content: HTML content of the page
+            start_time: Time the scan of this page started
+            
+        Returns:
+            ScanResult object with all found issues
+        """
+        # Parse HTML and index its elements once for all checks
+        soup = self._parse_html(page_content)
+        ElementIndex.for_soup(soup)
+        
+        # Extract page metadata
+        page_title = soup.title.string if soup.title else ""
+        page_description = ""
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc:
+            page_description = meta_desc.get('content', '')
+        
+        # Filter to only visible elements for scanning
+        visible_elements = filter_visible_elements(soup, self.viewport)
+        if not visible_elements:
+            # If no visible elements found, return success
+            return ScanResult(
+                url=url,
+                timestamp=None,
+                issues=[],
+                page_title=page_title,
+                page_description=page_description,
+                scan_duration=time.time() - start_time,
+                status="completed",
+                message="No visible content found to scan"
+            )
+        
+        # Run all accessibility checks
+        all_issues = []
+        for check in self.checks:
+            try:
+                issues = check.check(soup, url)
+                all_issues.extend(issues)
+            except Exception as e:
+                print(f"Warning: Check {check.__class__.__name__} failed: {e}")
+                continue
+        
+        # Drop issues below the configured severity before they are grouped
+        min_level = _SEVERITY_ORDER.get(self.min_severity, 1)
+        if min_level > 1:
+            all_issues = [
+                issue for issue in all_issues
+                if _SEVERITY_ORDER.get(issue.severity.value, 1) >= min_level
+            ]
+        
+        # Apply de-duplication to remove repetitive issues
+        all_issues = deduplicate_issues(all_issues)
+        
+        scan_duration = time.time() - start_time
+        
+        return ScanResult(
+            url=url,
+            timestamp=None,
+            issues=all_issues,
+            page_title=page_title,
+            page_description=page_description,
+            scan_duration=scan_duration,
+            status="completed"
+        )
+    
     async def scan_multiple(self, urls: List[str]) -> List[ScanResult]:
         """
         Scan multiple URLs for accessibility issues.
@@ -325,6 +371,34 @@ class AccessibilityScanner:
         print(f"✅ Completed scanning {len(urls)} URLs")
         return scan_results
     
+    def _parse_html(self, page_content: str) -> BeautifulSoup:
+        """
+        Parse page content with the configured parser.
+        
+        Defaults to html.parser, which records the source line of every
+        element for issue reports. ``parser: lxml`` is much faster but
+        records no source positions, so issues then carry no line numbers.
+        
+        Args:
+            page_content: HTML content of the page
+            
+        Returns:
+            BeautifulSoup object of the parsed HTML
+        """
+        try:
+            return BeautifulSoup(page_content, self.parser)
+        except FeatureNotFound:
+            # Configured parser isn't installed; fall back to the stdlib one
+            return BeautifulSoup(page_content, 'html.parser')
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the bounded pool used for page analysis, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="a11y-check"
+            )
+        return self._executor
+    
     async def _get_page_content(self, url: str) -> Optional[str]:
         """
         Get the HTML content of a webpage.
@@ -435,8 +509,7 @@ class AccessibilityScanner:
         Returns:
             Filtered list of ScanResult objects
         """
-        severity_order = {"low": 1, "moderate": 2, "critical": 3}
-        min_level = severity_order.get(min_severity.lower(), 1)
+        min_level = _SEVERITY_ORDER.get(min_severity.lower(), 1)
         
         filtered_results = []
         for result in scan_results:
@@ -446,7 +519,7 @@ class AccessibilityScanner:
             # Filter issues by severity
             filtered_issues = []
             for issue in result.issues:
-                issue_level = severity_order.get(issue.severity.value, 1)
+                issue_level = _SEVERITY_ORDER.get(issue.severity.value, 1)
                 if issue_level >= min_level:
                     filtered_issues.append(issue)
             
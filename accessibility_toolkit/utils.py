@@ -3,7 +3,9 @@ Utility functions for the accessibility toolkit.
 """
 
 from typing import List, Dict, Any
+from bs4 import BeautifulSoup
 from .models import AccessibilityIssue, IssueType, SeverityLevel
+from .element_index import ElementIndex
 
 
 def deduplicate_issues(issues: List[AccessibilityIssue]) -> List[AccessibilityIssue]:
@@ -171,8 +173,11 @@ def filter_visible_elements(soup, viewport_size: tuple = (1920, 1080)) -> List:
         'ul', 'ol', 'li', 'table', 'tr', 'td', 'th'  # List and table elements
     ]
     
+    # Look tags up in the page's shared element index
+    find_all = ElementIndex.for_soup(soup).find_all if isinstance(soup, BeautifulSoup) else soup.find_all
+    
     for tag in visible_tags:
-        elements = soup.find_all(tag)
+        elements = find_all(tag)
         for element in elements:
             if _is_element_visible(element):
                 visible_elements.append(element)
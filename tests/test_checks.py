@@ -0,0 +1,341 @@
+"""
+Unit tests for individual accessibility checks.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+from accessibility_toolkit.checks import (
+    AltTextCheck, ColorContrastCheck, FocusIndicatorCheck, FormAccessibilityCheck, HeadingHierarchyCheck,
+    KeyboardNavigationCheck,
+)
+from accessibility_toolkit.checks.base import _element_cache
+
+
+class TestAltTextCheck:
+    """Test AltTextCheck heuristics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = AltTextCheck({})
+
+    def test_inadequate_alt_text(self):
+        """Test detection of generic or too-short alt text."""
+        assert self.check._is_inadequate_alt("Image")
+        assert self.check._is_inadequate_alt("Click HERE for details")
+        assert self.check._is_inadequate_alt(" a ")
+        assert not self.check._is_inadequate_alt("Team celebrating the product launch")
+
+    def test_generic_terms_match_whole_words(self):
+        """Test that generic terms only match as whole words."""
+        assert not self.check._is_inadequate_alt("Imagery of the coastline")
+
+    def test_bare_image_reported_missing_alt(self):
+        """Test that an image with no alt attribute is reported by the full check."""
+        soup = BeautifulSoup('<p>Intro</p><img src="x.png">', "html.parser")
+        issues = self.check.check(soup, "https://example.com")
+        assert [issue.description for issue in issues] == ["Image missing alt text: x.png"]
+
+    def test_inadequate_alt_reported_by_check(self):
+        """Test that repeated generic alt texts are each reported by the full check."""
+        soup = BeautifulSoup(
+            '<img src="a.png" alt="icon"><img src="b.png" alt="Company logo"><img src="c.png" alt="icon">',
+            "html.parser",
+        )
+        issues = self.check.check(soup, "https://example.com")
+        assert [issue.element for issue in issues] == [
+            "<img src='a.png' alt='icon'>",
+            "<img src='c.png' alt='icon'>",
+        ]
+
+    def test_decorative_class_substring_match(self):
+        """Test that decorative class fragments match anywhere in a class name."""
+        soup = BeautifulSoup('<img class="hero BgImage" alt="x"><img class="hero" alt="x">', "html.parser")
+        first, second = soup.find_all("img")
+        assert self.check._is_decorative_image(first, "x")
+        assert not self.check._is_decorative_image(second, "x")
+
+    def test_small_image_dimensions(self):
+        """Test that only plain numeric small dimensions mark an image decorative."""
+        soup = BeautifulSoup(
+            '<img width="16" height=" 16 "><img width="16px" height="16"><img width="64" height="16">',
+            "html.parser",
+        )
+        small, with_units, wide = soup.find_all("img")
+        assert self.check._is_decorative_image(small, "x")
+        assert not self.check._is_decorative_image(with_units, "x")
+        assert not self.check._is_decorative_image(wide, "x")
+
+
+class TestElementMetadataCache:
+    """Test per-element memoisation in BaseCheck helpers."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = AltTextCheck({})
+        soup = BeautifulSoup('<main><p><img src="a.png"></p></main>', "html.parser")
+        self.img = soup.img
+
+    def test_element_info_is_fresh_copy(self):
+        """Test that cached element info can be mutated without leaking."""
+        first = self.check.get_element_info(self.img)
+        first["count"] = 3
+        assert "count" not in self.check.get_element_info(self.img)
+
+    def test_parent_context_cached_per_level(self):
+        """Test that parent context is memoised separately per depth."""
+        assert self.check.get_parent_context(self.img) == "<main> > <p>"
+        assert self.check.get_parent_context(self.img, levels=1) == "<p>"
+
+    def test_text_and_style_memoised(self):
+        """Test that stripped text and lower-cased style are read once per element."""
+        soup = BeautifulSoup('<p style="Color: RED"> Hello <b>world</b> </p>', "html.parser")
+        p = soup.p
+        calls = []
+        get_text = p.get_text
+        p.get_text = lambda *args, **kwargs: calls.append(args) or get_text(*args, **kwargs)
+        assert self.check.get_text_content(p) == "Helloworld"
+        assert self.check.get_text_content(p) == "Helloworld"
+        assert len(calls) == 1
+        assert self.check.get_style(p) == self.check.get_style(p) == "color: red"
+        assert {"text", "style"} <= _element_cache(p).keys()
+
+    def test_visibility_attribute_checks(self):
+        """Test hidden, aria-hidden and display:none detection."""
+        soup = BeautifulSoup(
+            '<p hidden>a</p><p aria-hidden="true">b</p><p style="DISPLAY:none">c</p>'
+            '<p></p><p><img src="a.png"></p><p>f</p>',
+            "html.parser",
+        )
+        visible = [self.check.is_visible_element(p) for p in soup.find_all("p")]
+        assert visible == [False, False, False, False, True, True]
+
+    def test_replaced_elements_visible_without_content(self):
+        """Test that void and replaced elements count as visible on their own."""
+        soup = BeautifulSoup('<img src="a.png"><input><svg></svg><img hidden><span></span>', "html.parser")
+        visible = [self.check.is_visible_element(e) for e in soup.find_all(True)]
+        assert visible == [True, True, True, False, False]
+
+
+class TestColorContrastCheck:
+    """Test ColorContrastCheck colour math."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = ColorContrastCheck({})
+
+    def test_contrast_ratio_matches_wcag(self):
+        """Test contrast ratios against known WCAG reference values."""
+        assert self.check._calculate_contrast_ratio("#000000", "#FFFFFF") == 21.0
+        assert self.check._calculate_contrast_ratio("#777777", "#FFFFFF") == 4.48
+        assert self.check._calculate_contrast_ratio("#FFFFFF", "#FFFFFF") == 1.0
+
+    def test_malformed_hex_colors_rejected(self):
+        """Test that only 3 or 6 digit hex colors are parsed."""
+        assert self.check._hex_to_rgb("#FfF") == (255, 255, 255)
+        for color in ("#-1-1-1", "#+f+f+f", "# ff ff", "#f_f", "#ffff", "#ffffffff", "#ggg"):
+            assert self.check._hex_to_rgb(color) is None
+        assert self.check._calculate_contrast_ratio("#-1-1-1", "#FFFFFF") is None
+
+    def test_dark_channels_use_linear_segment(self):
+        """Test that very dark channels use the linear part of the sRGB curve."""
+        assert self.check._calculate_luminance((10, 10, 10)) == pytest.approx((10 / 255) / 12.92)
+
+    def test_text_elements_found_once_in_document_order(self):
+        """Test that elements matching both a text tag and a text class are kept once."""
+        soup = BeautifulSoup(
+            '<section class="caption">c</section><p class="text">p</p><aside>a</aside>',
+            "html.parser",
+        )
+        elements = self.check._find_text_elements(soup)
+        assert [e.name for e in elements] == ["section", "p"]
+
+    def test_style_colors_extracted_in_one_scan(self):
+        """Test that foreground and background colors are told apart."""
+        fg, bg = self.check._extract_colors_from_style("background-color: #FFF; border-color: red; color: Navy")
+        assert (fg, bg) == ("#000080", "#fff")
+
+    def test_problematic_pairs_need_both_colors(self):
+        """Test that a problematic pair is reported only when both colours appear."""
+        soup = BeautifulSoup(
+            '<p style="border: 1px solid #FF0000; outline-color: #ffffff; box-shadow: 0 0 #333333">x</p>',
+            "html.parser",
+        )
+        assert self.check._extract_colors(soup.p) == [("#FF0000", "#FFFFFF")]
+
+
+class TestFocusIndicatorCheck:
+    """Test FocusIndicatorCheck CSS detection."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = FocusIndicatorCheck({})
+
+    def _descriptions(self, html):
+        soup = BeautifulSoup(html, "html.parser")
+        return [issue.description for issue in self.check.check(soup, "https://example.com")]
+
+    def test_outline_removed_in_focus_rule(self):
+        """Test that outline suppression inside a :focus rule is flagged."""
+        issues = self._descriptions("<style>a:focus, button:focus { outline:none }</style>")
+        assert issues == ["Stylesheet hides focus outlines on :focus selectors."]
+
+    def test_outline_removed_outside_focus_rule_ignored(self):
+        """Test that outline suppression in unrelated rules is not flagged."""
+        assert self._descriptions("<style>a:focus { outline: 2px solid } .x { outline: none }</style>") == []
+
+    def test_inline_outline_suppression(self):
+        """Test inline outline suppression on interactive elements."""
+        issues = self._descriptions('<button style="OUTLINE:0">Go</button><a href="/" style="outline: 1px">x</a>')
+        assert issues == ["Inline style removes focus outline on interactive element."]
+
+
+class TestFormAccessibilityCheck:
+    """Test FormAccessibilityCheck control handling."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = FormAccessibilityCheck({})
+
+    def test_control_issues_grouped_by_tag(self):
+        """Test that control issues keep the input, select, textarea order."""
+        soup = BeautifulSoup(
+            '<form><textarea></textarea><select></select><input type="text">'
+            '<input type="submit"></form>',
+            "html.parser",
+        )
+        form = soup.form
+        controls = form.find_all(["input", "select", "textarea"])
+        issues = self.check._check_form_elements(form, controls)
+        tags = [issue.additional_info["tag"] for issue in issues]
+        assert tags == sorted(tags, key=["input", "select", "textarea"].index)
+        assert tags[0] == "input"
+        assert self.check._is_complex_form(controls)
+
+    def test_same_issues_under_either_parser(self):
+        """Test that form issues do not depend on the parser backend."""
+        html = '<form><input type="text"><select></select><label for="t">T</label><textarea id="t"></textarea></form>'
+        default = self.check.check(BeautifulSoup(html, "html.parser"), "https://example.com")
+        with_lxml = self.check.check(BeautifulSoup(html, "lxml"), "https://example.com")
+        assert default
+        assert [issue.description for issue in with_lxml] == [issue.description for issue in default]
+
+    def test_label_for_resolved_across_form(self):
+        """Test that a label in a sibling container labels the control."""
+        soup = BeautifulSoup(
+            '<form><div><label for="n">Name</label></div><div><input id="n"><input id="m"></div></form>',
+            "html.parser",
+        )
+        named, unnamed = soup.find_all("input")
+        assert self.check._has_proper_label(named)
+        assert not self.check._has_proper_label(unnamed)
+
+
+class TestHeadingHierarchyCheck:
+    """Test HeadingHierarchyCheck structure rules."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = HeadingHierarchyCheck({})
+
+    @pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+    def test_single_pass_reports_in_order(self, parser):
+        """Test that skips, level gaps and multiple H1s keep their report order under either parser."""
+        soup = BeautifulSoup("<h3>a</h3><h1>b</h1><h5>c</h5><h1>d</h1>", parser)
+        descriptions = [issue.description for issue in self.check.check(soup, "https://example.com")]
+        assert descriptions == [
+            "Heading level jumps from 0 to 3 (skipping levels)",
+            "Heading level jumps from 1 to 5 (skipping levels)",
+            "Heading level 2 is missing from the page",
+            "Heading level 4 is missing from the page",
+            "Page has 2 H1 headings (should have only one)",
+        ]
+
+
+class TestKeyboardNavigationCheck:
+    """Test KeyboardNavigationCheck element discovery."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.check = KeyboardNavigationCheck({})
+
+    def test_skip_links_grouped_by_kind(self):
+        """Test that skip links are listed by href, then class, then text match."""
+        soup = BeautifulSoup(
+            '<a class="skip-nav" href="#top">a</a><a href="#content">b</a>'
+            '<a><b>Skip ahead</b></a><a href="#main">c</a>',
+            "html.parser",
+        )
+        links = self.check._find_skip_links(soup)
+        assert [link.get("href") for link in links] == ["#main", "#content", "#top", None]
+
+    def test_attribute_buckets_collected_once(self):
+        """Test that role, tabindex and trap buckets come from one memoised scan."""
+        soup = BeautifulSoup(
+            '<div role="tab" tabindex="0">t</div><span aria-hidden="true" data-focus-trap>x</span>',
+            "html.parser",
+        )
+        found = self.check._scan_elements(soup)
+        assert self.check._scan_elements(soup) is found
+        assert [e.name for e in found.by_role["tab"]] == ["div"]
+        assert [e.name for e in found.tabindex] == ["div"]
+        assert [e.name for e in found.aria_hidden] == [e.name for e in found.focus_traps] == ["span"]
+
+    def test_focusability_memoised_per_element(self):
+        """Test that focusability is worked out once and reused."""
+        soup = BeautifulSoup('<button>b</button><div tabindex="-1">d</div>', "html.parser")
+        button, div = soup.find_all(["button", "div"])
+        assert self.check._is_focusable(button)
+        assert not self.check._is_focusable(div)
+        # aria-hidden would make the button unfocusable if it were re-evaluated
+        button["aria-hidden"] = "true"
+        assert self.check._compute_focusable(button) is False
+        assert self.check._is_focusable(button)
+
+    def test_focus_indicator_class_names(self):
+        """Test that any class name containing 'focus' counts as an indicator."""
+        soup = BeautifulSoup('<a class="btn focus-ring">a</a><a class="btn">b</a>', "html.parser")
+        with_ring, plain = soup.find_all("a")
+        assert self.check._has_focus_indicator(with_ring)
+        assert not self.check._has_focus_indicator(plain)
+
+    def test_tabindex_must_be_an_integer(self):
+        """Test that only optionally negative integers are valid tabindex values."""
+        soup = BeautifulSoup(
+            '<div tabindex="-1">a</div><div tabindex="1-2">b</div><div tabindex="2">c</div>'
+            '<div tabindex="x">d</div><div tabindex="101">e</div>',
+            "html.parser",
+        )
+        divs = soup.find_all("div")
+        invalid = [issue.description for issue in self.check._check_tabindex_values(divs)]
+        assert invalid == [
+            "Element has invalid tabindex value: 1-2",
+            "Element has invalid tabindex value: x",
+        ]
+        high = self.check._check_logical_tab_order(soup, divs)
+        assert [issue.description for issue in high] == ["Element has very high tabindex value: 101"]
+
+    def test_focusable_elements_listed_once(self):
+        """Test that elements matched by several rules are only reported once."""
+        soup = BeautifulSoup(
+            '<a href="/" tabindex="x">a</a><button tabindex="0" contenteditable="true">b</button>'
+            '<button>c</button><button>c</button>',
+            "html.parser",
+        )
+        focusable = self.check._find_focusable_elements(soup)
+        assert [e.name for e in focusable] == ["a", "button", "button", "button"]
+        invalid = self.check._check_tabindex_values(focusable)
+        assert [issue.description for issue in invalid] == [
+            "Element has invalid tabindex value: x",
+            "Element has unnecessary tabindex='0': button",
+        ]
+
+    @pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+    def test_tab_order_follows_document_order(self, parser):
+        """Test that tab order issues follow the document under any parser."""
+        soup = BeautifulSoup('<div tabindex="150">d</div>\n<a href="/" tabindex="200">a</a>', parser)
+        focusable = self.check._find_focusable_elements(soup)
+        issues = self.check._check_logical_tab_order(soup, focusable)
+        assert [issue.description for issue in issues] == [
+            "Element has very high tabindex value: 150",
+            "Element has very high tabindex value: 200",
+        ]
@@ -0,0 +1,55 @@
+"""
+Unit tests for the shared single-pass element index.
+"""
+
+from bs4 import BeautifulSoup
+from accessibility_toolkit.element_index import ElementIndex
+
+
+HTML = """
+<html>
+<body>
+    <h2>Intro</h2>
+    <img src="a.png" aria-hidden="true">
+    <div onclick="go()">Go</div>
+    <h1>Title</h1>
+    <img src="b.png">
+</body>
+</html>
+"""
+
+
+class TestElementIndex:
+    """Test ElementIndex bucketing."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.soup = BeautifulSoup(HTML, "html.parser")
+        self.index = ElementIndex(self.soup)
+
+    def test_by_tag_matches_find_all(self):
+        """Test that tag buckets match bs4's find_all."""
+        assert self.index.by_tag["img"] == self.soup.find_all("img")
+        assert self.index.by_tag["video"] == []
+
+    def test_find_all_multiple_tags_in_document_order(self):
+        """Test that multi-tag lookups keep document order."""
+        headings = self.index.find_all(["h1", "h2"])
+        assert [h.name for h in headings] == ["h2", "h1"]
+
+    def test_attribute_buckets(self):
+        """Test the aria and onclick buckets."""
+        assert [e.get("src") for e in self.index.aria_elements] == ["a.png"]
+        assert [e.name for e in self.index.onclick_elements] == ["div"]
+
+    def test_for_soup_reuses_index(self):
+        """Test that the index is built once per soup."""
+        first = ElementIndex.for_soup(self.soup)
+        assert ElementIndex.for_soup(self.soup) is first
+
+    def test_position_is_document_order(self):
+        """Test that positions follow document order, not tag buckets."""
+        h1 = self.index.by_tag["h1"][0]
+        h2 = self.index.by_tag["h2"][0]
+        assert self.index.position(h2) < self.index.position(h1)
+        assert self.index.elements[self.index.position(h1)] is h1
@@ -140,6 +140,23 @@ class TestAccessibilityIssue:
         assert "[CRITICAL]" in issue_str
         assert "missing_alt_text" in issue_str
         assert "Test issue" in issue_str
+    
+    def test_issue_uses_slots(self):
+        """Test that issues are slotted and keep their defaults."""
+        issue = AccessibilityIssue(
+            issue_type=IssueType.MISSING_ALT_TEXT,
+            severity=SeverityLevel.CRITICAL,
+            description="Test issue",
+            element="<img>",
+            context="Test context"
+        )
+        
+        assert not hasattr(issue, "__dict__")
+        assert issue.line_number is None
+        assert issue.wcag_criteria == []
+        
+        issue.description = "Updated issue"
+        assert issue.description == "Updated issue"
 
 
 class TestScanResult:
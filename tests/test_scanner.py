@@ -0,0 +1,41 @@
+"""
+Unit tests for the accessibility scanner's page analysis.
+"""
+
+import time
+from accessibility_toolkit.scanner import AccessibilityScanner
+
+
+PAGE = """<html lang="en">
+<head><title>Test</title></head>
+<body>
+    <h1>Title</h1>
+    <a href="/" tabindex="abc">Home</a>
+</body>
+</html>
+"""
+
+
+class TestPageAnalysis:
+    """Test parsing and analysing a page without a browser."""
+
+    def test_default_parser_keeps_line_numbers(self):
+        """Test that issues carry source line numbers under the default config."""
+        scanner = AccessibilityScanner({})
+        result = scanner._analyze_page("https://example.com", PAGE, time.time())
+        tabindex_issues = [issue for issue in result.issues if "tabindex" in issue.description]
+        assert [issue.line_number for issue in tabindex_issues] == [5]
+
+    def test_empty_min_severity_keeps_all_issues(self):
+        """Test that a null min_severity setting means no filtering."""
+        scanner = AccessibilityScanner({"min_severity": None})
+        result = scanner._analyze_page("https://example.com", PAGE, time.time())
+        unfiltered = AccessibilityScanner({})._analyze_page("https://example.com", PAGE, time.time())
+        assert len(result.issues) == len(unfiltered.issues) > 0
+
+    def test_min_severity_is_case_insensitive(self):
+        """Test that an upper-case minimum severity still drops lower-ranked issues."""
+        scanner = AccessibilityScanner({"min_severity": "CRITICAL"})
+        result = scanner._analyze_page("https://example.com", PAGE, time.time())
+        assert result.issues
+        assert all(issue.severity.value == "critical" for issue in result.issues)